@@ -1,8 +1,33 @@
-from functools import singledispatch, singledispatchmethod
-from urllib.parse import urljoin
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from copy import deepcopy
+from dataclasses import field, make_dataclass
+from functools import partial, wraps
+from inspect import signature
+from itertools import chain, islice
+from threading import Lock
+from types import MappingProxyType
+import asyncio
+import atexit
+import os
+import time
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import RequestHistory
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    from json import dumps as _dumps, loads as _loads
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 
 media_type = dict(
@@ -20,4661 +45,1487 @@ media_type = dict(
     jsonp="text/javascript")
 
 server = 'http://rest.ensembl.org'
-session = requests.Session()
-adapter = HTTPAdapter(max_retries=Retry(backoff_factor=3600/55000,
-                                        respect_retry_after_header=True, status_forcelist=[429], allowed_methods=["GET", "POST"]))
-session.mount(server, adapter)
-
-
-def get(endpoint, params, format):
-    headers = {}
-    headers["Content-Type"] = media_type[format]
-    response = session.get(urljoin(server, endpoint),
-                           headers=headers, params=params)
-    if response.ok:
-        if headers["Content-Type"] == "application/json":
-            return response.json()
-        else:
-            return response.text
-    else:
+session = None
+# ids per VEP POST; 200 is the public server's cap, self-hosted VEP can match its --buffer_size
+vep_batch_size = 200
+_http2 = None
+# (connect, read) seconds; batch POSTs such as VEP can run for minutes server-side
+_TIMEOUT = (10.0, 30.0)
+_POST_TIMEOUT = (10.0, 300.0)
+_HTTPX_RETRIES = 5
+_SESSION_HEADERS = {"User-Agent": "ensemblrestpy", "Accept-Encoding": ACCEPT_ENCODING}
+
+_BASE = server.rstrip("/") + "/"
+# "bytes" is the undecoded JSON body, not an Ensembl content type
+_HEADERS_GET = {fmt: {"Accept": mt} for fmt, mt in media_type.items()} | {"bytes": {"Accept": "application/json"}}
+_HEADERS_POST = {fmt: {"Content-Type": mt, "Accept": mt} for fmt, mt in media_type.items()} | {
+    "bytes": {"Content-Type": "application/json", "Accept": "application/json"}}
+_NO_PARAMS = MappingProxyType({})
+_LINE_FORMATS = frozenset({"bed", "fasta", "gff3"})
+_RAW_FORMATS = frozenset({"bytes", "fasta", "nh", "orthoxml", "phyloxml", "seqxml", "xml"})
+# release-scoped reference data; the on-disk cache is named per release, so these keep for a week
+_REFERENCE_URLS = (
+    "*/info/biotypes/*",
+    "*/info/compara/*",
+    "*/info/variation/consequence_types",
+    "*/ontology/*",
+    "*/regulatory/species/*/epigenome",
+    "*/regulatory/species/*/microarray",
+    "*/species/*/binding_matrix/*",
+    "*/taxonomy/*",
+)
+_VALIDATORS = (("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified"))
+
+_cond_cache = OrderedDict()
+_cond_cache_size = 8192
+_cond_lock = Lock()
+
+# fixed no-argument info endpoints whose PreparedRequest is built once and reused
+_STATIC = frozenset({
+    "info/comparas",
+    "info/data",
+    "info/divisions",
+    "info/eg_version",
+    "info/ping",
+    "info/rest",
+    "info/software",
+})
+_prepared = {}
+
+_inflight = {}
+_inflight_lock = Lock()
+_ainflight = {}
+
+ENSEMBL_PARALLEL_PARSE = False
+_PARALLEL_PARSE_MIN = 1_048_576
+_parse_pool = None
+
+_async_session = None
+_async_mode = ContextVar("_async_mode", default=False)
+
+
+class _TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._stamp = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate) - 1
+            self._stamp = now
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def observe(self, headers):
+        limit, period = headers.get("X-RateLimit-Limit"), headers.get("X-RateLimit-Period")
+        if limit and period and float(limit) / float(period) < self.rate:
+            with self._lock:
+                self.rate = float(limit) / float(period)
+        if headers.get("X-RateLimit-Remaining") == "0":
+            with self._lock:
+                self._tokens = min(self._tokens, -float(headers.get("X-RateLimit-Reset") or 1) * self.rate)
+
+
+_BUCKET = _TokenBucket(rate=15, burst=15)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        _BUCKET.acquire()
+        response = super().send(request, **kwargs)
+        _BUCKET.observe(response.headers)
+        return response
+
+
+class _Retry(Retry):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429:
+            method = "GET"
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+_RETRY = _Retry(total=5, backoff_factor=1.0, backoff_jitter=0.5, backoff_max=32, respect_retry_after_header=True,
+                status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"], raise_on_status=False)
+_THROTTLED = RequestHistory(None, None, None, 429, None)
+
+
+def _backoff(headers, attempt):
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return _RETRY.parse_retry_after(retry_after)
+    return _RETRY.new(history=(_THROTTLED,) * (attempt + 1)).get_backoff_time()
+
+
+def _release():
+    try:
+        response = requests.get(_BASE + "info/data", headers={**_SESSION_HEADERS, **_HEADERS_GET["json"]},
+                                timeout=_TIMEOUT)
         response.raise_for_status()
+        return max(_loads(response.content)["releases"])
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return None
+
+
+def get_session(transport="requests"):
+    global session, _http2
+    if transport == "httpx":
+        if _http2 is None:
+            _http2 = _http2_client()
+        return _http2
+    if session is None:
+        if requests_cache is not None:
+            release = _release()
+            reference_expiry = 86400 if release is None else 7 * 86400
+            session = requests_cache.CachedSession(cache_name=f"ensembl-{release or 'current'}", backend="sqlite",
+                                                   use_cache_dir=True, expire_after=86400, allowable_methods=("GET",),
+                                                   urls_expire_after={"*/info/ping": requests_cache.DO_NOT_CACHE,
+                                                                      **dict.fromkeys(_REFERENCE_URLS,
+                                                                                      reference_expiry)},
+                                                   cache_control=True)
+        else:
+            session = requests.Session()
+        session.headers.update(_SESSION_HEADERS)
+        adapter = _RateLimitedAdapter(pool_connections=32, pool_maxsize=32, pool_block=False,
+                                      max_retries=_RETRY)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    return session
+
+
+def _http2_client(timeout=30.0):
+    import httpx
+
+    limits = httpx.Limits(max_connections=40, max_keepalive_connections=20, keepalive_expiry=75)
+    return httpx.Client(headers=_SESSION_HEADERS, timeout=httpx.Timeout(timeout, connect=10.0),
+                        transport=httpx.HTTPTransport(http2=True, retries=3, limits=limits))
+
+
+def use_http2(timeout=30.0):
+    global session
+    session = _http2_client(timeout)
+
+
+def close_session():
+    global session, _http2
+    for pool in (session, _http2):
+        if pool is not None:
+            pool.close()
+    session = _http2 = None
+    _prepared.clear()
+
+
+atexit.register(close_session)
+
+
+def _reset_after_fork():
+    global session, _http2
+    session = _http2 = None
+    _prepared.clear()
 
 
-def post(endpoint, params, json, format):
-    headers = {}
-    headers["Content-Type"] = media_type[format]
-    headers['Accept'] = media_type[format]
-    response = session.post(urljoin(server, endpoint),
-                            headers=headers, params=params, json=json)
-    if response.ok:
-        if headers["Accept"] == "application/json":
-            return response.json()
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _timeout_for(method, timeout=None):
+    return timeout or (_POST_TIMEOUT if method == "POST" else _TIMEOUT)
+
+
+def _atimeout(transport, timeout):
+    if transport == "httpx":
+        import httpx
+
+        return httpx.Timeout(timeout[1], connect=timeout[0])
+    import aiohttp
+
+    return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+
+
+def _send_prepared(session, method, url, headers, timeout):
+    key = (session, method, url, tuple(headers.items()))
+    prepared = _prepared.get(key)
+    if prepared is None:
+        prep = session.prepare_request(requests.Request(method, url, headers=headers))
+        settings = session.merge_environment_settings(prep.url, {}, None, None, None)
+        prepared = _prepared[key] = (prep, settings)
+    prep, settings = prepared
+    return session.send(prep.copy(), timeout=timeout, **settings)
+
+
+def _request(method, endpoint, headers, params, json=None, stream=False, base=None, session=None, timeout=None):
+    url = (base or _BASE) + endpoint.lstrip("/")
+    timeout = _timeout_for(method, timeout)
+    if session is None:
+        session = get_session()
+    data = None if json is None else _dumps(json)
+    if isinstance(session, requests.Session):
+        if endpoint in _STATIC and not params and data is None and not stream:
+            return _send_prepared(session, method, url, headers, timeout)
+        return session.request(method, url, headers=headers, params=params, data=data, stream=stream,
+                               timeout=timeout)
+    request = session.build_request(method, url, headers=headers, params=params, content=data,
+                                    timeout=_atimeout("httpx", timeout))
+    for attempt in range(_HTTPX_RETRIES + 1):
+        _BUCKET.acquire()
+        response = session.send(request, stream=stream)
+        _BUCKET.observe(response.headers)
+        if response.status_code != 429 or attempt == _HTTPX_RETRIES:
+            return response
+        response.close()
+        time.sleep(_backoff(response.headers, attempt))
+
+
+def _iter_body(response, response_format):
+    response.raise_for_status()
+    if not isinstance(response, requests.Response):
+        if response_format in _LINE_FORMATS:
+            return response.iter_lines()
+        chunks = response.iter_bytes(chunk_size=65536)
+    elif response_format in _LINE_FORMATS:
+        response.encoding = response.encoding or "utf-8"
+        return response.iter_lines(decode_unicode=True)
+    else:
+        chunks = response.iter_content(chunk_size=65536)
+    if response_format == "json":
+        return _iter_json(chunks)
+    return chunks
+
+
+def _iter_json(chunks):
+    import ijson
+
+    chunks = iter(chunks)
+    first = next(chunks, b"")
+    events = ijson.sendable_list()
+    parser = ijson.items_coro(events, "item" if first.lstrip()[:1] == b"[" else "", use_float=True)
+    for chunk in chain((first,), chunks):
+        parser.send(chunk)
+        yield from events
+        del events[:]
+    parser.close()
+    yield from events
+
+
+async def _aiter_json(chunks):
+    import ijson
+
+    events = ijson.sendable_list()
+    parser = None
+    async for chunk in chunks:
+        if parser is None:
+            parser = ijson.items_coro(events, "item" if chunk.lstrip()[:1] == b"[" else "", use_float=True)
+        parser.send(chunk)
+        for record in events:
+            yield record
+        del events[:]
+    if parser is not None:
+        parser.close()
+        for record in events:
+            yield record
+
+
+async def _aiter_body(response, response_format):
+    httpx = hasattr(response, "aiter_bytes")
+    if response_format in _LINE_FORMATS:
+        if httpx:
+            async for line in response.aiter_lines():
+                yield line
+        else:
+            async for line in response.content:
+                yield line.decode().rstrip("\r\n")
+        return
+    chunks = response.aiter_bytes(65536) if httpx else response.content.iter_chunked(65536)
+    if response_format == "json":
+        chunks = _aiter_json(chunks)
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _achain(iterables):
+    for iterable in iterables:
+        async for item in iterable:
+            yield item
+
+
+@asynccontextmanager
+async def _aresponse(open, retries):
+    for attempt in range(retries + 1):
+        await asyncio.sleep(_BUCKET.reserve())
+        async with open() as response:
+            _BUCKET.observe(response.headers)
+            status = response.status_code if hasattr(response, "status_code") else response.status
+            if status != 429 or attempt == retries:
+                response.raise_for_status()
+                yield response
+                return
+            delay = _backoff(response.headers, attempt)
+        await asyncio.sleep(delay)
+
+
+def _decode(response, response_format):
+    response.raise_for_status()
+    if response_format == "json":
+        return _loads(response.content)
+    if response_format in _RAW_FORMATS:
+        return response.content
+    return response.text
+
+
+def to_str(body, encoding="utf-8"):
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return str(body, encoding)
+    return body
+
+
+def _request_key(endpoint, params, response_format):
+    key = (endpoint, response_format, tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _coalesce(key, fn, *args):
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if leader:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+        return future.result()
+    return deepcopy(future.result())
+
+
+def get(endpoint, params, response_format, stream=False):
+    if _async_mode.get():
+        if stream:
+            return _astream("GET", endpoint, params, None, _HEADERS_GET[response_format], response_format)
+        return aget(endpoint, params, response_format)
+    if stream:
+        response = _request("GET", endpoint, _HEADERS_GET[response_format], params, stream=True)
+        return _iter_body(response, response_format)
+    key = _request_key(endpoint, params, response_format)
+    if key is None:
+        return _get(endpoint, params, response_format, None)
+    return _coalesce(key, _get, endpoint, params, response_format, key)
+
+
+def _get(endpoint, params, response_format, key):
+    headers = _HEADERS_GET[response_format]
+    if requests_cache is not None and isinstance(get_session(), requests_cache.CachedSession):
+        key = None
+    with _cond_lock:
+        cached = _cond_cache.get(key)
+        if cached is not None:
+            _cond_cache.move_to_end(key)
+    if cached is not None:
+        headers = {**headers, **cached[0]}
+    response = _request("GET", endpoint, headers, params)
+    if cached is not None and response.status_code == 304:
+        return deepcopy(cached[1])
+    body = _decode(response, response_format)
+    if key is not None:
+        validators = {h: response.headers[v] for h, v in _VALIDATORS if v in response.headers}
+        if validators:
+            with _cond_lock:
+                _cond_cache[key] = (validators, body)
+                _cond_cache.move_to_end(key)
+                if len(_cond_cache) > _cond_cache_size:
+                    _cond_cache.popitem(last=False)
+            return deepcopy(body)
+    return body
+
+
+def post(endpoint, params, json, response_format, stream=False):
+    if _async_mode.get():
+        if stream:
+            return _astream("POST", endpoint, params, json, _HEADERS_POST[response_format], response_format)
+        return apost(endpoint, params, json, response_format)
+    headers = _HEADERS_POST[response_format]
+    response = _request("POST", endpoint, headers, params, json, stream)
+    if stream:
+        return _iter_body(response, response_format)
+    return _decode(response, response_format)
+
+
+def _params(**kwargs):
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+_memoized = []
+_memo_size = 4096
+_memo_ttl = 3600.0
+
+
+def _memoize(fn, registry=_memoized):
+    cache = OrderedDict()
+    lock = Lock()
+    callback_index = list(signature(fn).parameters).index("callback")
+
+    @wraps(fn)
+    def wrapper(*args, no_cache=False, **kwargs):
+        callback = args[callback_index] if len(args) > callback_index else kwargs.get("callback")
+        if no_cache or callback is not None or _async_mode.get():
+            return fn(*args, **kwargs)
+        key = (args, tuple(kwargs.items()))
+        now = time.monotonic()
+        try:
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and hit[0] > now:
+                    cache.move_to_end(key)
+                    return deepcopy(hit[1])
+        except TypeError:
+            return fn(*args, **kwargs)
+        value = fn(*args, **kwargs)
+        with lock:
+            cache[key] = (now + _memo_ttl, value)
+            cache.move_to_end(key)
+            if len(cache) > _memo_size:
+                cache.popitem(last=False)
+        return deepcopy(value)
+    wrapper.cache_clear = cache.clear
+    if registry is not None:
+        registry.append(wrapper)
+    return wrapper
+
+
+def clear_cache():
+    for fn in _memoized:
+        fn.cache_clear()
+    with _cond_lock:
+        _cond_cache.clear()
+    _prepared.clear()
+    if requests_cache is not None and isinstance(session, requests_cache.CachedSession):
+        session.cache.clear()
+
+
+def _get_async_session():
+    global _async_session
+    if _async_session is None or _async_session.closed:
+        import aiohttp
+
+        _async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=_atimeout("aiohttp", _TIMEOUT))
+    return _async_session
+
+
+async def close_async_session():
+    global _async_session
+    if _async_session is not None:
+        await _async_session.close()
+        _async_session = None
+
+
+def _get_parse_pool():
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+async def _aloads(body):
+    if ENSEMBL_PARALLEL_PARSE and len(body) > _PARALLEL_PARSE_MIN:
+        return await asyncio.get_running_loop().run_in_executor(_get_parse_pool(), _loads, body)
+    return _loads(body)
+
+
+async def _acoalesce(key, fn, *args):
+    key = (asyncio.get_running_loop(), key)
+    task = _ainflight.get(key)
+    if task is None:
+        task = _ainflight[key] = asyncio.ensure_future(fn(*args))
+        task.add_done_callback(lambda _: _ainflight.pop(key, None))
+        return await asyncio.shield(task)
+    return deepcopy(await asyncio.shield(task))
+
+
+async def aget(endpoint, params, response_format):
+    key = _request_key(endpoint, params, response_format)
+    if key is None:
+        return await _aget(endpoint, params, response_format)
+    return await _acoalesce(key, _aget, endpoint, params, response_format)
+
+
+def _aopen(method, endpoint, headers, params, json):
+    data = None if json is None else _dumps(json)
+    url = _BASE + endpoint.lstrip("/")
+    timeout = _atimeout("aiohttp", _timeout_for(method))
+    return lambda: _get_async_session().request(method, url, headers=headers, params=params, data=data,
+                                                timeout=timeout)
+
+
+async def _arequest(method, endpoint, params, json, headers, response_format):
+    async with _aresponse(_aopen(method, endpoint, headers, params, json), _HTTPX_RETRIES) as response:
+        if response_format == "json":
+            return await _aloads(await response.read())
+        elif response_format in _RAW_FORMATS:
+            return await response.read()
+        else:
+            return await response.text()
+
+
+async def _aget(endpoint, params, response_format):
+    return await _arequest("GET", endpoint, params, None, _HEADERS_GET[response_format], response_format)
+
+
+async def apost(endpoint, params, json, response_format):
+    return await _arequest("POST", endpoint, params, json, _HEADERS_POST[response_format], response_format)
+
+
+async def _astream(method, endpoint, params, json, headers, response_format):
+    async with _aresponse(_aopen(method, endpoint, headers, params, json), _HTTPX_RETRIES) as response:
+        async for record in _aiter_body(response, response_format):
+            yield record
+
+
+def _make_async(fn):
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = _async_mode.set(True)
+        try:
+            coro = fn(*args, **kwargs)
+        finally:
+            _async_mode.reset(token)
+        return coro if hasattr(coro, "__aiter__") else await coro
+    wrapper.__name__ = wrapper.__qualname__ = f"{fn.__name__}_async"
+    return wrapper
+
+
+# (name, method, path, positional args, keyword args[, json body args])
+_ENDPOINTS = [
+    ("cafe_tree", "GET", "cafe/genetree/id/{id}", ("id",), ("callback", "compara", "nh_response_format")),
+    ("cafe_tree_member_id", "GET", "cafe/genetree/member/id/{id}", ("id",),
+     ("callback", "compara", "db_type", "nh_response_format", "object_type", "species")),
+    ("cafe_tree_member_symbol", "GET", "cafe/genetree/member/symbol/{species}/{symbol}", ("species", "symbol"),
+     ("callback", "compara", "db_type", "external_db", "nh_response_format", "object_type")),
+    ("cafe_tree_species_member_id", "GET", "cafe/genetree/member/id/{species}/{id}", ("id", "species"),
+     ("callback", "compara", "db_type", "nh_response_format", "object_type")),
+    ("genetree", "GET", "genetree/id/{id}", ("id",),
+     ("aligned", "callback", "cigar_line", "clusterset_id", "compara", "nh_response_format", "prune_species",
+      "prune_taxon", "sequence")),
+    ("genetree_member_id", "GET", "genetree/member/id/{id}", ("id",),
+     ("aligned", "callback", "cigar_line", "clusterset_id", "compara", "db_type", "nh_response_format",
+      "object_type", "prune_species", "prune_taxon", "sequence", "species")),
+    ("genetree_member_symbol", "GET", "genetree/member/symbol/{species}/{symbol}", ("species", "symbol"),
+     ("aligned", "callback", "cigar_line", "clusterset_id", "compara", "db_type", "external_db",
+      "nh_response_format", "object_type", "prune_species", "prune_taxon", "sequence")),
+    ("genetree_species_member_id", "GET", "genetree/member/id/{species}/{id}", ("id", "species"),
+     ("aligned", "callback", "cigar_line", "clusterset_id", "compara", "db_type", "nh_response_format",
+      "object_type", "prune_species", "prune_taxon", "sequence")),
+    ("genomic_alignment_region", "GET", "alignment/region/{species}/{region}", ("region", "species"),
+     ("aligned", "callback", "compact", "compara", "display_species_set", "mask", "method", "species_set",
+      "species_set_group")),
+    ("homology_ensemblgene", "GET", "homology/id/{id}", ("id",),
+     ("aligned", "callback", "cigar_line", "compara", "format", "sequence", "target_species", "target_taxon", "type")),
+    ("homology_species_gene_id", "GET", "homology/id/{species}/{id}", ("id", "species"),
+     ("aligned", "callback", "cigar_line", "compara", "format", "sequence", "target_species", "target_taxon", "type")),
+    ("homology_symbol", "GET", "homology/symbol/{species}/{symbol}", ("species", "symbol"),
+     ("aligned", "callback", "cigar_line", "compara", "external_db", "format", "sequence", "target_species",
+      "target_taxon", "type")),
+    ("xref_external", "GET", "xrefs/symbol/{species}/{symbol}", ("species", "symbol"),
+     ("callback", "db_type", "external_db", "object_type")),
+    ("xref_id", "GET", "xrefs/id/{id}", ("id",),
+     ("all_levels", "callback", "db_type", "external_db", "object_type", "species")),
+    ("xref_name", "GET", "xrefs/name/{species}/{name}", ("name", "species"), ("callback", "db_type", "external_db")),
+    ("analysis", "GET", "info/analysis/{species}", ("species",), ("callback",)),
+    ("assembly_info", "GET", "info/assembly/{species}", ("species",), ("bands", "callback", "synonyms")),
+    ("assembly_stats", "GET", "info/assembly/{species}/{region_name}", ("region_name", "species"),
+     ("bands", "callback", "synonyms")),
+    ("biotypes", "GET", "info/biotypes/{species}", ("species",), ("callback",)),
+    ("biotypes_groups", "GET", "info/biotypes/groups/{group}/{object_type}", (), ("callback", "group", "object_type")),
+    ("biotypes_name", "GET", "info/biotypes/name/{name}/{object_type}", ("name",), ("callback", "object_type")),
+    ("compara_methods", "GET", "info/compara/methods", (), ("callback", "compara", "**kwargs")),
+    ("compara_species_sets", "GET", "info/compara/species_sets/{method}", ("method",), ("callback", "compara")),
+    ("comparas", "GET", "info/comparas", (), ("callback",)),
+    ("data", "GET", "info/data", (), ("callback",)),
+    ("eg_version", "GET", "info/eg_version", (), ("callback",)),
+    ("external_dbs", "GET", "info/external_dbs/{species}", ("species",), ("callback", "feature", "filter")),
+    ("info_divisions", "GET", "info/divisions", (), ("callback",)),
+    ("info_genome", "GET", "info/genomes/{name}", ("name",), ("callback", "expand")),
+    ("info_genomes_accession", "GET", "info/genomes/accession/{accession}", ("accession",), ("callback", "expand")),
+    ("info_genomes_assembly", "GET", "info/genomes/assembly/{assembly_id}", ("assembly_id",), ("callback", "expand")),
+    ("info_genomes_division", "GET", "info/genomes/division/{division}", ("division",), ("callback", "expand")),
+    ("info_genomes_taxonomy", "GET", "info/genomes/taxonomy/{taxon_name}", ("taxon_name",), ("callback", "expand")),
+    ("ping", "GET", "info/ping", (), ("callback",)),
+    ("rest", "GET", "info/rest", (), ("callback",)),
+    ("software", "GET", "info/software", (), ("callback",)),
+    ("species", "GET", "info/species", (), ("callback", "division", "hide_strain_info", "strain_collection")),
+    ("variation", "GET", "info/variation/{species}", ("species",), ("callback", "filter")),
+    ("variation_consequence_types", "GET", "info/variation/consequence_types", (), ("callback", "rank")),
+    ("variation_population_name", "GET", "info/variation/populations/{species}/{population_name}",
+     ("population_name", "species"),
+     ("callback",)),
+    ("variation_populations", "GET", "info/variation/populations/{species}", ("species",), ("callback", "filter")),
+    ("ld_id_get", "GET", "ld/{species}/{id}/{population_name}", ("id", "population_name", "species"),
+     ("attribs", "callback", "d_prime", "r2", "window_size")),
+    ("ld_pairwise_get", "GET", "ld/{species}/pairwise/{id1}/{id2}", ("id1", "id2", "species"),
+     ("callback", "d_prime", "population_name", "r2")),
+    ("ld_region_get", "GET", "ld/{species}/region/{region}/{population_name}",
+     ("population_name", "region", "species"),
+     ("callback", "d_prime", "r2")),
+    ("assembly_cdna", "GET", "map/cdna/{id}/{region}", ("id", "region"),
+     ("callback", "include_original_region", "species")),
+    ("assembly_cds", "GET", "map/cds/{id}/{region}", ("id", "region"),
+     ("callback", "include_original_region", "species")),
+    ("assembly_map", "GET", "map/{species}/{asm_one}/{region}/{asm_two}", ("asm_one", "asm_two", "region", "species"),
+     ("callback", "coord_system", "target_coord_system")),
+    ("assembly_translation", "GET", "map/translation/{id}/{region}", ("id", "region"), ("callback", "species")),
+    ("ontology_ancestors", "GET", "ontology/ancestors/{id}", ("id",), ("callback", "ontology")),
+    ("ontology_ancestors_chart", "GET", "ontology/ancestors/chart/{id}", ("id",), ("callback", "ontology")),
+    ("ontology_descendants", "GET", "ontology/descendants/{id}", ("id",),
+     ("callback", "closest_term", "ontology", "subset", "zero_distance")),
+    ("ontology_id", "GET", "ontology/id/{id}", ("id",), ("callback", "relation", "simple")),
+    ("ontology_name", "GET", "ontology/name/{name}", ("name",), ("callback", "ontology", "relation", "simple")),
+    ("taxonomy_classification", "GET", "taxonomy/classification/{id}", ("id",), ("callback",)),
+    ("taxonomy_id", "GET", "taxonomy/id/{id}", ("id",), ("callback", "simple")),
+    ("taxonomy_name", "GET", "taxonomy/name/{name}", ("name",), ("callback",)),
+    ("overlap_id", "GET", "overlap/id/{id}", ("id", "feature"),
+     ("biotype", "callback", "db_type", "logic_name", "misc_set", "object_type", "so_term", "species", "species_set",
+      "variant_set")),
+    ("overlap_region", "GET", "overlap/region/{species}/{region}", ("species", "region", "feature"),
+     ("biotype", "callback", "db_type", "logic_name", "misc_set", "so_term", "species_set", "trim_downstream",
+      "trim_upstream", "variant_set")),
+    ("overlap_translation", "GET", "overlap/translation/{id}", ("id",),
+     ("callback", "db_type", "feature", "so_term", "species", "type")),
+    ("phenotype_accession", "GET", "phenotype/accession/{species}/{accession}", ("species", "accession"),
+     ("callback", "include_children", "include_pubmed_id", "include_review_status", "source")),
+    ("phenotype_gene", "GET", "phenotype/gene/{species}/{gene}", ("species", "gene"),
+     ("callback", "include_associated", "include_overlap", "include_pubmed_id", "include_review_status",
+      "include_submitter", "non_specified", "trait", "tumour")),
+    ("phenotype_region", "GET", "phenotype/region/{species}/{region}", ("species", "region"),
+     ("callback", "feature_type", "include_pubmed_id", "include_review_status", "include_submitter", "non_specified",
+      "only_phenotypes", "trait", "tumour")),
+    ("phenotype_term", "GET", "phenotype/term/{species}/{term}", ("species", "term"),
+     ("callback", "include_children", "include_pubmed_id", "include_review_status", "source")),
+    ("array", "GET", "regulatory/species/{species}/microarray/{microarray}/vendor/{vendor}",
+     ("species", "microarray", "vendor"),
+     ("callback",)),
+    ("fetch_all_epigenomes", "GET", "regulatory/species/{species}/epigenome", ("species",), ("callback",)),
+    ("get_binding_matrix", "GET", "species/{species}/binding_matrix/{binding_matrix}/", ("species", "binding_matrix"),
+     ("callback", "unit")),
+    ("list_all_microarrays", "GET", "regulatory/species/{species}/microarray", ("species",), ("callback",)),
+    ("probe", "GET", "regulatory/species/{species}/microarray/{microarray}/probe/{probe}",
+     ("species", "microarray", "probe"),
+     ("callback", "gene", "transcripts")),
+    ("probe_set", "GET", "regulatory/species/{species}/microarray/{microarray}/probe_set/{probe_set}",
+     ("species", "microarray", "probe_set"),
+     ("callback", "gene", "transcripts")),
+    ("regulatory_id", "GET", "regulatory/species/{species}/id/{id}", ("species", "id"), ("activity", "callback")),
+    ("transcript_haplotypes_get", "GET", "transcript_haplotypes/{species}/{id}", ("id", "species"),
+     ("aligned_sequences", "callback", "samples", "sequence")),
+    ("variation_pmcid_get", "GET", "variation/{species}/pmcid/{pmcid}", ("pmcid", "species"), ("callback",)),
+    ("variation_pmid_get", "GET", "variation/{species}/pmid/{pmid}", ("pmid", "species"), ("callback",)),
+    ("beacon_get", "GET", "ga4gh/beacon", (), ("callback",)),
+    ("beacon_query_get", "GET", "ga4gh/beacon/query", (), ("**kwargs",)),
+    ("beacon_query_post", "POST", "ga4gh/beacon/query", (), ("**kwargs",), ("**kwargs",)),
+    ("features_id", "GET", "ga4gh/features/{id}", ("id",), ("callback",)),
+    ("features_post", "POST", "ga4gh/features/search", (), ("**kwargs",), ("**kwargs",)),
+    ("gacallSet", "POST", "ga4gh/callsets/search", (), ("**kwargs",), ("**kwargs",)),
+    ("gacallset_id", "GET", "ga4gh/callsets/{id}", ("id",), ("callback",)),
+    ("gadataset", "POST", "ga4gh/datasets/search", (),
+     ("callback", "pageSize", "pageToken"),
+     ("pageSize", "pageToken")),
+    ("gadataset_id", "GET", "ga4gh/datasets/{id}", ("id",), ("callback",)),
+    ("gafeatureset", "POST", "ga4gh/featuresets/search", ("datasetId",),
+     ("callback", "pageSize", "pageToken"),
+     ("datasetId", "pageSize", "pageToken")),
+    ("gafeatureset_id", "GET", "ga4gh/featuresets/{id}", ("id",), ("callback",)),
+    ("gavariant_id", "GET", "ga4gh/variants/{id}", ("id",), ("callback",)),
+    ("gavariantannotations", "POST", "ga4gh/variantannotations/search", ("variantAnnotationSetId",),
+     ("callback", "effects", "end", "pageSize", "pageToken", "referenceId", "referenceName", "start"),
+     ("variantAnnotationSetId", "effects", "end", "pageSize", "pageToken", "referenceId", "referenceName", "start")),
+    ("gavariants", "POST", "ga4gh/variants/search", ("end", "referenceName", "start", "variantSetId"),
+     ("callSetIds", "callback", "pageSize", "pageToken"),
+     ("pageSize", "pageToken", "callSetIds", "end", "referenceName", "start", "variantSetId")),
+    ("gavariantset", "POST", "ga4gh/variantsets/search", ("datasetId",),
+     ("callback", "pageSize", "pageToken"),
+     ("datasetId", "pageSize", "pageToken")),
+    ("gavariantset_id", "GET", "ga4gh/variantsets/{id}", ("id",), ("callback",)),
+    ("references", "POST", "ga4gh/references/search", ("referenceSetId",),
+     ("accession", "callback", "md5checksum", "pageSize", "pageToken"),
+     ("accession", "referenceSetId", "md5checksum", "pageSize", "pageToken")),
+    ("references_id", "GET", "ga4gh/references/{id}", ("id",), ("callback",)),
+    ("referenceSets", "POST", "ga4gh/referencesets/search", (),
+     ("accession", "callback", "pageSize", "pageToken"),
+     ("accession", "pageSize", "pageToken")),
+    ("referenceSets_id", "GET", "ga4gh/referencesets/{id}", ("id",), ("callback",)),
+    ("VariantAnnotationSet", "POST", "ga4gh/variantannotationsets/search", ("variantSetId",),
+     ("callback", "pageSize", "pageToken"),
+     ("variantSetId", "pageSize", "pageToken")),
+    ("VariantAnnotationSet_id", "GET", "ga4gh/variantannotationsets/{id}", ("id",), ("callback",)),
+]
+
+_MEMOIZED = frozenset({
+    "assembly_cdna",
+    "assembly_cds",
+    "assembly_info",
+    "assembly_map",
+    "assembly_translation",
+    "biotypes",
+    "compara_methods",
+    "comparas",
+    "data",
+    "eg_version",
+    "external_dbs",
+    "info_divisions",
+    "rest",
+    "software",
+    "species",
+    "variation_consequence_types",
+    "ontology_ancestors",
+    "ontology_ancestors_chart",
+    "ontology_descendants",
+    "ontology_id",
+    "ontology_name",
+    "phenotype_term",
+    "probe",
+    "probe_set",
+    "regulatory_id",
+    "taxonomy_classification",
+    "taxonomy_id",
+    "taxonomy_name",
+    "array",
+    "beacon_get",
+    "features_id",
+    "fetch_all_epigenomes",
+    "get_binding_matrix",
+    "list_all_microarrays",
+    "variation_pmcid_get",
+    "variation_pmid_get",
+    "VariantAnnotationSet_id",
+    "gacallset_id",
+    "gadataset_id",
+    "gafeatureset_id",
+    "gavariant_id",
+    "gavariantset_id",
+    "referenceSets_id",
+    "references_id",
+})
+
+_STREAMING = frozenset({
+    "genetree",
+    "genomic_alignment_region",
+    "ld_id_get",
+    "ld_region_get",
+    "overlap_region",
+    "sequence_id",
+    "sequence_region",
+    "vep_hgvs",
+    "vep_id",
+    "vep_region",
+})
+
+_OVERLAP_FEATURES = frozenset({
+    "array_probe", "band", "cds", "constrained", "exon", "gene", "mane", "misc", "motif", "other_regulatory",
+    "regulatory", "repeat", "simple", "somatic_structural_variation", "somatic_variation", "structural_variation",
+    "transcript", "variation",
+})
+
+# enumerated parameters checked before the request is sent
+_CHOICES = {
+    "overlap_id": {"feature": _OVERLAP_FEATURES},
+    "overlap_region": {"feature": _OVERLAP_FEATURES},
+    "overlap_translation": {"feature": frozenset({
+        "protein_feature", "residue_variation", "somatic_transcript_variation", "transcript_variation",
+        "translation_exon",
+    })},
+}
+
+
+def _check_choice(name, key, value):
+    choices = _CHOICES[name][key]
+    for v in value if isinstance(value, (list, tuple)) else (value,):
+        if v is not None and v not in choices:
+            raise ValueError(f"{name}() got an unsupported {key}: {v!r}")
+
+
+def _url(path):
+    return f'{"f" if "{" in path else ""}"{path}"'
+
+
+def _filter_source(var, names, indent):
+    source = f"{indent}{var} = {{}}\n"
+    for k in names:
+        if k == "**kwargs":
+            source += f"{indent}{var}.update((k, v) for k, v in kwargs.items() if v is not None)\n"
         else:
-            return response.text
+            source += f"{indent}if {k} is not None:\n{indent}    {var}[\"{k}\"] = {k}\n"
+    return source
+
+
+def _make_wrapper(name, method, path, args, keywords, body=(), stream=False, bound=False):
+    star = "**kwargs" in keywords
+    keywords = [k for k in keywords if k != "**kwargs"]
+    target = "self." if bound else ""
+    signature = ["self"] * bound + [f"{a}: str" for a in args] + [f"{k}=None" for k in keywords] + ['response_format="json"']
+    if stream:
+        signature.append("stream=False")
+    if star:
+        signature.append("**kwargs")
+    query = [k for k in args if f"{{{k}}}" not in path and k not in body]
+    query += [k for k in keywords if k not in body]
+    if star and "**kwargs" not in body:
+        query.append("**kwargs")
+    source = "".join(f'    _check_choice("{name}", "{k}", {k})\n' for k in _CHOICES.get(name, ()))
+    if len(query) == 1 and query[0] != "**kwargs":
+        source += f'    params = {{"{query[0]}": {query[0]}}} if {query[0]} is not None else _NO_PARAMS\n'
+    elif query:
+        source += _filter_source("params", query, "    ")
+    params = "params" if query else "_NO_PARAMS"
+    extra = ", stream=stream" if stream else ""
+    if method == "GET":
+        call = f'{target}get({_url(path)}, {params}, response_format{extra})'
     else:
-        response.raise_for_status()
+        json = "json"
+        if body == ("**kwargs",):
+            source += "    json = {k: v for k, v in kwargs.items() if v is not None}\n"
+        else:
+            source += _filter_source("json", body, "    ")
+        call = f'{target}post({_url(path)}, {params}, {json}, response_format{extra})'
+    namespace = {}
+    exec(f"def {name}({', '.join(signature)}):\n{source}    return {call}\n", globals(), namespace)
+    return namespace[name]
+
+
+for _spec in _ENDPOINTS:
+    _fn = _make_wrapper(*_spec, stream=_spec[0] in _STREAMING)
+    globals()[_fn.__name__] = _memoize(_fn) if _fn.__name__ in _MEMOIZED else _fn
+del _spec, _fn
+
+
+_VEP_KEYWORDS = (
+    "AncestralAllele", "Blosum62", "CADD", "DisGeNET", "EVE", "GO", "GeneSplicer", "Geno2MP", "IntAct", "LoF",
+    "Mastermind", "MaveDB", "MaxEntScan", "NMD", "Phenotypes", "SpliceAI", "UTRAnnotator", "appris", "callback",
+    "canonical", "ccds", "dbNSFP", "dbscSNV", "distance", "domains", "failed", "flag_pick", "flag_pick_allele",
+    "flag_pick_allele_gene", "ga4gh_vrs", "gencode_basic", "hgvs", "mane", "merged", "minimal", "mirna", "mutfunc",
+    "numbers", "per_gene", "pick", "pick_allele", "pick_allele_gene", "pick_order", "protein", "refseq",
+    "shift_3prime", "shift_genomic", "transcript_id", "transcript_version", "tsl", "uniprot", "variant_class",
+    "vcf_string", "xref_refseq",
+)
+
+
+def _options_post_init(self):
+    params = _params(**{k: getattr(self, k) for k in self.__match_args__})
+    object.__setattr__(self, "params", MappingProxyType(params))
+
+
+VepOptions = make_dataclass(
+    "VepOptions",
+    [(k, object, field(default=None)) for k in sorted(_VEP_KEYWORDS + ("Conservation", "ambiguous_hgvs"))]
+    + [("params", dict, field(init=False, repr=False, compare=False))],
+    namespace={"__post_init__": _options_post_init}, frozen=True, slots=True, module=__name__)
+
+_OPTIONS = {"vep_hgvs": "VepOptions", "vep_id": "VepOptions", "vep_region": "VepOptions"}
+
+
+def _with_options(options, params):
+    return params if options is None else {**options.params, **params}
+
+
+# POST-shaped result from the GET response for a one-element list
+_SINGLE = {
+    "sequence_id": lambda item, body: body if isinstance(body, list) else [body],
+    "variant_recoder": lambda item, body: body,
+    "variation_id": lambda item, body: {item: body},
+    "vep_hgvs": lambda item, body: body,
+    "vep_id": lambda item, body: body,
+}
+
+
+def _single(body, item, shape):
+    if _async_mode.get():
+        return _asingle(body, item, shape)
+    return shape(item, body)
+
+
+async def _asingle(body, item, shape):
+    return shape(item, await body)
+
+
+# (name, GET path, POST path, positional args, GET keyword args, POST keyword args, POST body key)
+_DISPATCH_ENDPOINTS = [
+    ("archive_id", "archive/id/{id}", "archive/id", ("id",), ("callback",), ("callback",), "id"),
+    ("lookup", "lookup/id/{id}", "lookup/id", ("id",),
+     ("callback", "db_type", "expand", "format", "mane", "phenotypes", "species", "utr"),
+     ("callback", "db_type", "expand", "format", "object_type", "species"), "ids"),
+    ("symbol_lookup", "lookup/symbol/{species}/{symbol}", "lookup/symbol/{species}", ("symbol", "species"),
+     ("callback", "expand", "format"), ("callback", "expand", "format"), "symbols"),
+    ("sequence_id", "sequence/id/{id}", "sequence/id", ("id",),
+     ("callback", "db_type", "end", "expand_3prime", "expand_5prime", "format", "mask", "mask_feature",
+      "multiple_sequences", "object_type", "species", "start", "type"),
+     ("callback", "db_type", "end", "expand_3prime", "expand_5prime", "format", "mask", "mask_feature",
+      "object_type", "species", "start", "type"), "ids"),
+    ("sequence_region", "sequence/region/{species}/{region}", "sequence/region/{species}", ("region", "species"),
+     ("callback", "coord_system", "coord_system_version", "expand_3prime", "expand_5prime", "mask", "mask_feature"),
+     ("callback", "coord_system", "coord_system_version", "expand_3prime", "expand_5prime", "format", "mask",
+      "mask_feature"), "regions"),
+    ("vep_hgvs", "vep/{species}/hgvs/{hgvs_notation}", "vep/{species}/hgvs", ("hgvs_notation", "species"),
+     _VEP_KEYWORDS + ("Conservation", "ambiguous_hgvs"), _VEP_KEYWORDS + ("ambiguous_hgvs",), "hgvs_notations"),
+    ("vep_id", "vep/{species}/id/{id}", "vep/{species}/id", ("id", "species"),
+     _VEP_KEYWORDS + ("Conservation",), _VEP_KEYWORDS, "ids"),
+    ("vep_region", "vep/{species}/region/{region}/{allele}/", "vep/{species}/region", ("region", "allele", "species"),
+     _VEP_KEYWORDS + ("Conservation",), _VEP_KEYWORDS, "variants"),
+    ("variant_recoder", "variant_recoder/{species}/{id}", "variant_recoder/{species}", ("id", "species"),
+     ("callback", "failed", "fields", "ga4gh_vrs", "gencode_basic", "minimal", "var_synonyms", "vcf_string"),
+     ("callback", "failed", "fields", "ga4gh_vrs", "gencode_basic", "minimal", "var_synonyms", "vcf_string"),
+     "ids"),
+    ("variation_id", "variation/{species}/{id}", "variation/{species}/", ("id", "species"),
+     ("callback", "genotypes", "genotyping_chips", "phenotypes", "pops", "population_genotypes"),
+     ("callback", "genotypes", "phenotypes", "pops", "population_genotypes"), "ids"),
+]
+
+
+def _required_source(name, args, indent):
+    return "".join(f"{indent}if {a} is None:\n"
+                   f"{indent}    raise TypeError(\"{name}() missing required argument: '{a}'\")\n" for a in args)
+
+
+def _make_dispatch_wrapper(name, get_path, post_path, args, get_keywords, post_keywords, body, stream=False,
+                           options=None, single=False, bound=False):
+    items = args[0]
+    target = "self." if bound else ""
+    post_args = (items,) + tuple(a for a in args[1:] if f"{{{a}}}" in post_path)
+    if post_args == args:
+        signature = [f"{items}: str | list"] + [f"{a}: str" for a in args[1:]]
+        shift = required = ""
+    else:
+        signature = [f"{items}: str | list"] + [f"{a}=None" for a in args[1:]]
+        shift = "".join(f"        if {p} is None:\n            {p} = {a}\n" for p, a in zip(post_args, args) if p != a)
+        shift += _required_source(name, post_args[1:], "        ")
+        required = _required_source(name, args[1:], "    ")
+    signature = ["self"] * bound + signature
+    signature += [f"{k}=None" for k in sorted(set(get_keywords) | set(post_keywords))] + ['response_format="json"']
+    extra = ""
+    if stream:
+        signature.append("stream=False")
+        extra = ", stream=stream"
+    if options:
+        signature.append(f"options: {options} = None")
+
+    def params(keywords, indent):
+        source = _filter_source("params", keywords, indent)
+        if options:
+            source += f"{indent}params = _with_options(options, params)\n"
+        return source
+
+    single_get = ""
+    if single:
+        single_get = (f"        if len({items}) == 1 and response_format == \"json\"{' and not stream' if stream else ''}:\n"
+                      f"            {items} = {items}[0]\n"
+                      f"{params(get_keywords, '            ')}"
+                      f"            body = get({_url(get_path)}, params, response_format)\n"
+                      f"            return _single(body, {items}, _SINGLE[\"{name}\"])\n")
+    namespace = {}
+    exec(f"def {name}({', '.join(signature)}):\n"
+         f"    if isinstance({items}, (list, tuple)):\n"
+         f"{single_get}"
+         f"{shift}"
+         f"{params(post_keywords, '        ')}"
+         f"        return {target}post({_url(post_path)}, params, {{\"{body}\": {items}}}, response_format{extra})\n"
+         f"{required}"
+         f"{params(get_keywords, '    ')}"
+         f"    return {target}get({_url(get_path)}, params, response_format{extra})\n", globals(), namespace)
+    return namespace[name]
+
+
+for _spec in _DISPATCH_ENDPOINTS:
+    _fn = _make_dispatch_wrapper(*_spec, stream=_spec[0] in _STREAMING, options=_OPTIONS.get(_spec[0]),
+                                 single=_spec[0] in _SINGLE)
+    globals()[_fn.__name__] = _fn
+del _spec, _fn
+
+
+_POST_CAPS = {
+    "archive_id": 1000,
+    "lookup": 1000,
+    "symbol_lookup": 1000,
+    "sequence_id": 50,
+    "sequence_region": 50,
+    "variant_recoder": 200,
+    "variation_id": 200,
+    "vep_hgvs": 200,
+    "vep_id": 200,
+    "vep_region": 200,
+}
+
+
+def _merge_chunks(results):
+    if isinstance(results[0], dict):
+        merged = {}
+        for result in results:
+            merged.update(result)
+        return merged
+    if isinstance(results[0], list):
+        return [entry for result in results for entry in result]
+    head = results[0].lstrip()[:1]
+    if head in (b"[", b"{"):
+        body = b",".join(filter(None, (result.strip()[1:-1].strip() for result in results)))
+        return head + body + (b"]" if head == b"[" else b"}")
+    return results[0][:0].join(results)
+
+
+async def _agather_chunks(coroutines):
+    return _merge_chunks(await asyncio.gather(*coroutines))
+
+
+# POST endpoints answering with an object keyed by id rather than a list
+_POST_MAPS = frozenset({"lookup", "symbol_lookup", "variation_id"})
+
+
+def _empty_result(name, response_format="json", stream=False, **kwargs):
+    if stream:
+        return iter(())
+    if response_format == "json":
+        return {} if name in _POST_MAPS else []
+    if response_format == "bytes":
+        return b"{}" if name in _POST_MAPS else b"[]"
+    return b"" if response_format in _RAW_FORMATS else ""
+
+
+async def _aresult(value):
+    return value
+
+
+def _post_cap(name, client=None):
+    if name.startswith("vep_"):
+        return vep_batch_size if client is None else client.vep_batch_size
+    return _POST_CAPS[name]
+
+
+def _split_first(args, kwargs, bound, name):
+    if len(args) > bound:
+        return args[:bound], args[bound], args[bound + 1:]
+    if name not in kwargs:
+        raise TypeError(f"missing required argument: '{name}'")
+    return args, kwargs.pop(name), ()
+
+
+def _chunked_post(fn, bound=False):
+    first = list(signature(fn).parameters)[bound]
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        head, items, args = _split_first(args, kwargs, bound, first)
+        cap = _post_cap(fn.__name__, *head)
+        if not isinstance(items, (list, tuple)) or 0 < len(items) <= cap:
+            return fn(*head, items, *args, **kwargs)
+        asynchronous = _async_mode.get() or bound and isinstance(head[0], AsyncEnsembl)
+        if not items:
+            empty = _empty_result(fn.__name__, **kwargs)
+            if not asynchronous:
+                return empty
+            return _achain(()) if kwargs.get("stream") else _aresult(empty)
+        chunks = [items[i:i + cap] for i in range(0, len(items), cap)]
+        if kwargs.get("stream") and asynchronous:
+            return _achain([fn(*head, chunk, *args, **kwargs) for chunk in chunks])
+        if kwargs.get("stream"):
+            return chain.from_iterable(fn(*head, chunk, *args, **kwargs) for chunk in chunks)
+        if asynchronous:
+            return _agather_chunks([fn(*head, chunk, *args, **kwargs) for chunk in chunks])
+        with ThreadPoolExecutor(min(len(chunks), 8)) as executor:
+            return _merge_chunks(list(executor.map(lambda chunk: fn(*head, chunk, *args, **kwargs), chunks)))
+
+    return wrapper
+
+
+# GET-only id endpoints; a list of ids is fetched concurrently into {id: result}
+_FAN_OUT = frozenset({
+    "VariantAnnotationSet_id",
+    "gacallset_id",
+    "gadataset_id",
+    "gafeatureset_id",
+    "gavariant_id",
+    "gavariantset_id",
+    "referenceSets_id",
+    "references_id",
+    "xref_id",
+})
 
 
-@singledispatch
-def archive_id(id: str, callback=None, response_format="json"):
-    return get(
-        endpoint=f"archive/id/{id}", params=dict(callback=callback), response_format=response_format
-    )
-
-
-@archive_id.register
-def _(id: list, callback=None, response_format="json"):
-    return post(
-        endpoint="archive/id",
-        params=dict(callback=callback),
-        response_format=response_format,
-        json={"id": id},
-    )
-
-
-def cafe_tree(id: str, callback=None, compara=None, nh_response_format=None, response_format="json"):
-    return get(
-        f"cafe/genetree/id/{id}",
-        params=dict(callback=callback, compara=compara,
-                    nh_response_format=nh_response_format),
-        response_format=response_format,
-    )
-
-
-def cafe_tree_member_id(
-        id: str,
-        callback=None,
-        compara=None,
-        db_type=None,
-        nh_response_format=None,
-        object_type=None,
-        species=None,
-        response_format="json"):
-    return get(
-        f"cafe/genetree/member/id/{id}",
-        params=dict(
-            callback=callback,
-            compara=compara,
-            db_type=db_type,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-            species=species,
-        ),
-        response_format=response_format,
-    )
-
-
-def cafe_tree_member_symbol(
-        species: str,
-        symbol: str,
-        callback=None,
-        compara=None,
-        db_type=None,
-        external_db=None,
-        nh_response_format=None,
-        object_type=None,
-        response_format="json"):
-    return get(
-        f"cafe/genetree/member/symbol/{species}/{symbol}",
-        params=dict(
-            callback=callback,
-            compara=compara,
-            db_type=db_type,
-            external_db=external_db,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-        ),
-        response_format=response_format,
-    )
-
-
-def cafe_tree_species_member_id(
-        id: str,
-        species: str,
-        callback=None,
-        compara=None,
-        db_type=None,
-        nh_response_format=None,
-        object_type=None,
-        response_format="json"):
-    return get(
-        f"cafe/genetree/member/id/{species}/{id}",
-        params=dict(
-            callback=callback,
-            compara=compara,
-            db_type=db_type,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-        ),
-        response_format=response_format,
-    )
-
-
-def genetree(
-        id: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        clusterset_id=None,
-        compara=None,
-        nh_response_format=None,
-        prune_species=None,
-        prune_taxon=None,
-        sequence=None,
-        response_format="json"):
-    return get(
-        f"genetree/id/{id}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            clusterset_id=clusterset_id,
-            compara=compara,
-            nh_response_format=nh_response_format,
-            prune_species=prune_species,
-            prune_taxon=prune_taxon,
-            sequence=sequence,
-        ),
-        response_format=response_format,
-    )
-
-
-def genetree_member_id(
-        id: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        clusterset_id=None,
-        compara=None,
-        db_type=None,
-        nh_response_format=None,
-        object_type=None,
-        prune_species=None,
-        prune_taxon=None,
-        sequence=None,
-        species=None,
-        response_format="json"):
-    return get(
-        f"genetree/member/id/{id}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            clusterset_id=clusterset_id,
-            compara=compara,
-            db_type=db_type,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-            prune_species=prune_species,
-            prune_taxon=prune_taxon,
-            sequence=sequence,
-            species=species,
-        ),
-        response_format=response_format,
-    )
-
-
-def genetree_member_symbol(
-        species: str,
-        symbol: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        clusterset_id=None,
-        compara=None,
-        db_type=None,
-        external_db=None,
-        nh_response_format=None,
-        object_type=None,
-        prune_species=None,
-        prune_taxon=None,
-        sequence=None,
-        response_format="json"):
-    return get(
-        f"genetree/member/symbol/{species}/{symbol}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            clusterset_id=clusterset_id,
-            compara=compara,
-            db_type=db_type,
-            external_db=external_db,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-            prune_species=prune_species,
-            prune_taxon=prune_taxon,
-            sequence=sequence,
-        ),
-        response_format=response_format,
-    )
-
-
-def genetree_species_member_id(
-        id: str,
-        species: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        clusterset_id=None,
-        compara=None,
-        db_type=None,
-        nh_response_format=None,
-        object_type=None,
-        prune_species=None,
-        prune_taxon=None,
-        sequence=None,
-        response_format="json"):
-    return get(
-        f"genetree/member/id/{species}/{id}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            clusterset_id=clusterset_id,
-            compara=compara,
-            db_type=db_type,
-            nh_response_format=nh_response_format,
-            object_type=object_type,
-            prune_species=prune_species,
-            prune_taxon=prune_taxon,
-            sequence=sequence,
-        ),
-        response_format=response_format,
-    )
-
-
-def genomic_alignment_region(
-        region: str,
-        species: str,
-        aligned=None,
-        callback=None,
-        compact=None,
-        compara=None,
-        display_species_set=None,
-        mask=None,
-        method=None,
-        species_set=None,
-        species_set_group=None,
-        response_format="json"):
-    return get(
-        f"alignment/region/{species}/{region}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            compact=compact,
-            compara=compara,
-            display_species_set=display_species_set,
-            mask=mask,
-            method=method,
-            species_set=species_set,
-            species_set_group=species_set_group,
-        ),
-        response_format=response_format,
-    )
-
-
-def homology_ensemblgene(
-        id: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        compara=None,
-        format=None,
-        sequence=None,
-        target_species=None,
-        target_taxon=None,
-        type=None,
-        response_format="json"):
-    return get(
-        f"homology/id/{id}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            compara=compara,
-            response_format=response_format,
-            sequence=sequence,
-            target_species=target_species,
-            target_taxon=target_taxon,
-            type=type,
-        ),
-        response_format=response_format,
-    )
-
-
-def homology_species_gene_id(
-        id: str,
-        species: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        compara=None,
-        format=None,
-        sequence=None,
-        target_species=None,
-        target_taxon=None,
-        type=None,
-        response_format="json"):
-    return get(
-        f"homology/id/{species}/{id}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            compara=compara,
-            response_format=response_format,
-            sequence=sequence,
-            target_species=target_species,
-            target_taxon=target_taxon,
-            type=type,
-        ),
-        response_format=response_format,
-    )
-
-
-def homology_symbol(
-        species: str,
-        symbol: str,
-        aligned=None,
-        callback=None,
-        cigar_line=None,
-        compara=None,
-        external_db=None,
-        format=None,
-        sequence=None,
-        target_species=None,
-        target_taxon=None,
-        type=None,
-        response_format="json"):
-    return get(
-        f"homology/symbol/{species}/{symbol}",
-        params=dict(
-            aligned=aligned,
-            callback=callback,
-            cigar_line=cigar_line,
-            compara=compara,
-            external_db=external_db,
-            response_format=response_format,
-            sequence=sequence,
-            target_species=target_species,
-            target_taxon=target_taxon,
-            type=type,
-        ),
-        response_format=response_format,
-    )
-
-
-def xref_external(
-        species: str,
-        symbol: str,
-        callback=None,
-        db_type=None,
-        external_db=None,
-        object_type=None,
-        response_format="json"):
-    return get(
-        f"xrefs/symbol/{species}/{symbol}",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            external_db=external_db,
-            object_type=object_type,
-        ),
-        response_format=response_format,
-    )
-
-
-def xref_id(
-        id: str,
-        all_levels=None,
-        callback=None,
-        db_type=None,
-        external_db=None,
-        object_type=None,
-        species=None,
-        response_format="json"):
-    return get(
-        f"xrefs/id/{id}",
-        params=dict(
-            all_levels=all_levels,
-            callback=callback,
-            db_type=db_type,
-            external_db=external_db,
-            object_type=object_type,
-            species=species,
-        ),
-        response_format=response_format,
-    )
-
-
-def xref_name(name: str, species: str, callback=None, db_type=None, external_db=None, response_format="json"):
-    return get(
-        f"xrefs/name/{species}/{name}",
-        params=dict(callback=callback, db_type=db_type,
-                    external_db=external_db),
-        response_format=response_format,
-    )
-
-
-def analysis(species: str, callback=None, response_format="json"):
-    return get(
-        f"info/analysis/{species}", params=dict(callback=callback), response_format=response_format
-    )
-
-
-def assembly_info(species: str, bands=None, callback=None, synonyms=None, response_format="json"):
-    return get(
-        f"info/assembly/{species}",
-        params=dict(bands=bands, callback=callback, synonyms=synonyms),
-        response_format=response_format,
-    )
-
-
-def assembly_stats(
-        region_name: str, species: str, bands=None, callback=None, synonyms=None, response_format="json"):
-    return get(
-        f"info/assembly/{species}/{region_name}",
-        params=dict(bands=bands, callback=callback, synonyms=synonyms),
-        response_format=response_format,
-    )
-
-
-def biotypes(species: str, callback=None, response_format="json"):
-    return get(
-        f"info/biotypes/{species}", params=dict(callback=callback), response_format=response_format
-    )
-
-
-def biotypes_groups(callback=None, group=None, object_type=None, response_format="json"):
-    return get(
-        f"info/biotypes/groups/{group}/{object_type}",
-        params=dict(callback=callback, group=group, object_type=object_type),
-        response_format=response_format,
-    )
-
+async def _agather_ids(ids, coroutines):
+    return dict(zip(ids, await asyncio.gather(*coroutines)))
 
-def biotypes_name(name: str, callback=None, object_type=None, response_format="json"):
-    return get(
-        f"info/biotypes/name/{name}/{object_type}",
-        params=dict(callback=callback, object_type=object_type),
-        response_format=response_format,
-    )
 
+def _fan_out(fn, bound=False):
+    first = list(signature(fn).parameters)[bound]
 
-def compara_methods(callback=None, compara=None, response_format="json", **kwargs):
-    return get(
-        f"info/compara/methods",
-        params=dict(callback=callback, compara=compara, **kwargs),
-        response_format=response_format,
-    )
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        head, id, args = _split_first(args, kwargs, bound, first)
+        if not isinstance(id, (list, tuple)):
+            return fn(*head, id, *args, **kwargs)
+        if _async_mode.get() or bound and isinstance(head[0], AsyncEnsembl):
+            return _agather_ids(id, [fn(*head, i, *args, **kwargs) for i in id])
+        with ThreadPoolExecutor(max(1, min(len(id), 8))) as executor:
+            return dict(zip(id, executor.map(lambda i: fn(*head, i, *args, **kwargs), id)))
 
+    return wrapper
 
-def compara_species_sets(method: str, callback=None, compara=None, response_format="json"):
-    return get(
-        f"info/compara/species_sets/{method}",
-        params=dict(callback=callback, compara=compara),
-        response_format=response_format,
-    )
 
+for _name in _POST_CAPS:
+    globals()[_name] = _chunked_post(globals()[_name])
 
-def comparas(callback=None, response_format="json"):
-    return get(f"info/comparas", params=dict(callback=callback), response_format=response_format)
+for _name in _FAN_OUT:
+    globals()[_name] = _fan_out(globals()[_name])
 
+for _name, _fn in list(globals().items()):
+    if (callable(_fn) and not isinstance(_fn, type) and getattr(_fn, "__module__", None) == __name__
+            and not _name.startswith("_")
+            and _name not in ("get", "post", "aget", "apost", "clear_cache", "close_async_session",
+                          "close_session", "get_session", "to_str", "use_http2")):
+        globals()[f"{_name}_async"] = _make_async(_fn)
+del _name, _fn
 
-def data(callback=None, response_format="json"):
-    return get(f"info/data", params=dict(callback=callback), response_format=response_format)
 
+def iter_batches(fn, ids, *args, **kwargs):
+    ids = iter(ids)
+    cap = _post_cap(fn.__name__, getattr(fn, "__self__", None))
+    while chunk := list(islice(ids, cap)):
+        yield fn(chunk, *args, **kwargs)
 
-def eg_version(callback=None, response_format="json"):
-    return get(f"info/eg_version", params=dict(callback=callback), response_format=response_format)
 
+def _make_many(fn, empty):
+    def many(ids, *args, **kwargs):
+        results = list(iter_batches(fn, ids, *args, **kwargs))
+        return _merge_chunks(results) if results else empty()
 
-def external_dbs(species: str, callback=None, feature=None, filter=None, response_format="json"):
-    return get(
-        f"info/external_dbs/{species}",
-        params=dict(callback=callback, feature=feature, filter=filter),
-        response_format=response_format,
-    )
+    many.__name__ = many.__qualname__ = f"{fn.__name__}_many"
+    return many
 
 
-def info_divisions(callback=None, response_format="json"):
-    return get(f"info/divisions", params=dict(callback=callback), response_format=response_format)
+for _name, _empty in (("lookup", dict), ("symbol_lookup", dict), ("sequence_id", list), ("vep_hgvs", list),
+                      ("vep_id", list)):
+    globals()[f"{_name}_many"] = _make_many(globals()[_name], _empty)
+del _name, _empty
 
 
-def info_genome(name: str, callback=None, expand=None, response_format="json"):
-    return get(
-        f"info/genomes/{name}",
-        params=dict(callback=callback, expand=expand),
-        response_format=response_format,
-    )
+def map_concurrent(fn, arg_iter, max_workers=16, **common_kwargs):
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(lambda arg: fn(arg, **common_kwargs), arg_iter))
 
 
-def info_genomes_accession(accession: str, callback=None, expand=None, response_format="json"):
-    return get(
-        f"info/genomes/accession/{accession}",
-        params=dict(callback=callback, expand=expand),
-        response_format=response_format,
-    )
+def prefetch_map(fn, iterable, lookahead=8, **kwargs):
+    with ThreadPoolExecutor(lookahead) as executor:
+        pending = deque()
+        for item in iterable:
+            pending.append(executor.submit(fn, item, **kwargs))
+            if len(pending) > lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
-def info_genomes_assembly(assembly_id: str, callback=None, expand=None, response_format="json"):
-    return get(
-        f"info/genomes/assembly/{assembly_id}",
-        params=dict(callback=callback, expand=expand),
-        response_format=response_format,
-    )
+def iter_pages(fn, *args, pageToken=None, **kwargs):
+    with ThreadPoolExecutor(1) as executor:
+        future = executor.submit(fn, *args, pageToken=pageToken, **kwargs)
+        while future is not None:
+            page = future.result()
+            token = page.get("nextPageToken")
+            future = executor.submit(fn, *args, pageToken=token, **kwargs) if token else None
+            yield page
 
 
-def info_genomes_division(division: str, callback=None, expand=None, response_format="json"):
-    return get(
-        f"info/genomes/division/{division}",
-        params=dict(callback=callback, expand=expand),
-        response_format=response_format,
-    )
+async def gather_many(fn, items, max_inflight=20, **kwargs):
+    semaphore = asyncio.Semaphore(max_inflight)
 
+    async def run(item):
+        async with semaphore:
+            return await fn(item, **kwargs)
 
-def info_genomes_taxonomy(taxon_name: str, callback=None, expand=None, response_format="json"):
-    return get(
-        f"info/genomes/taxonomy/{taxon_name}",
-        params=dict(callback=callback, expand=expand),
-        response_format=response_format,
-    )
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
 
 
-def ping(callback=None, response_format="json"):
-    return get(f"info/ping", params=dict(callback=callback), response_format=response_format)
+async def _run_and_close(coroutine):
+    try:
+        return await coroutine
+    finally:
+        await close_async_session()
 
 
-def rest(callback=None, response_format="json"):
-    return get(f"info/rest", params=dict(callback=callback), response_format=response_format)
-
-
-def software(callback=None, response_format="json"):
-    return get(f"info/software", params=dict(callback=callback), response_format=response_format)
-
-
-def species(
-        callback=None, division=None, hide_strain_info=None, strain_collection=None, response_format="json"):
-    return get(
-        f"info/species",
-        params=dict(
-            callback=callback,
-            division=division,
-            hide_strain_info=hide_strain_info,
-            strain_collection=strain_collection,
-        ),
-        response_format=response_format,
-    )
-
-
-def variation(species: str, callback=None, filter=None, response_format="json"):
-    return get(
-        f"info/variation/{species}",
-        params=dict(callback=callback, filter=filter),
-        response_format=response_format,
-    )
-
-
-def variation_consequence_types(callback=None, rank=None, response_format="json"):
-    return get(
-        f"info/variation/consequence_types",
-        params=dict(callback=callback, rank=rank),
-        response_format=response_format,
-    )
-
-
-def variation_population_name(population_name: str, species: str, callback=None, response_format="json"):
-    return get(
-        f"info/variation/populations/{species}/{population_name}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def variation_populations(species: str, callback=None, filter=None, response_format="json"):
-    return get(
-        f"info/variation/populations/{species}",
-        params=dict(callback=callback, filter=filter),
-        response_format=response_format,
-    )
-
-
-def ld_id_get(
-        id: str,
-        population_name: str,
-        species: str,
-        attribs=None,
-        callback=None,
-        d_prime=None,
-        r2=None,
-        window_size=None,
-        response_format="json"):
-    return get(
-        f"ld/{species}/{id}/{population_name}",
-        params=dict(
-            attribs=attribs,
-            callback=callback,
-            d_prime=d_prime,
-            r2=r2,
-            window_size=window_size,
-        ),
-        response_format=response_format,
-    )
-
-
-def ld_pairwise_get(
-        id1: str,
-        id2: str,
-        species: str,
-        callback=None,
-        d_prime=None,
-        population_name=None,
-        r2=None,
-        response_format="json"):
-    return get(
-        f"ld/{species}/pairwise/{id1}/{id2}",
-        params=dict(
-            callback=callback, d_prime=d_prime, population_name=population_name, r2=r2
-        ),
-        response_format=response_format,
-    )
-
-
-def ld_region_get(
-        population_name: str,
-        region: str,
-        species: str,
-        callback=None,
-        d_prime=None,
-        r2=None,
-        response_format="json"):
-    return get(
-        f"ld/{species}/region/{region}/{population_name}",
-        params=dict(callback=callback, d_prime=d_prime, r2=r2),
-        response_format=response_format,
-    )
-
-
-@singledispatch
-def lookup(
-        id: str,
-        callback=None,
-        db_type=None,
-        expand=None,
-        format=None,
-        mane=None,
-        phenotypes=None,
-        species=None,
-        utr=None,
-        response_format="json"):
-    return get(
-        f"lookup/id/{id}",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            expand=expand,
-            response_format=response_format,
-            mane=mane,
-            phenotypes=phenotypes,
-            species=species,
-            utr=utr,
-        ),
-        response_format=response_format,
-    )
-
-
-@lookup.register
-def _(
-        id: list,
-        callback=None,
-        db_type=None,
-        expand=None,
-        format=None,
-        object_type=None,
-        species=None,
-        response_format="json"):
-    return post(
-        f"lookup/id",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            expand=expand,
-            response_format=response_format,
-            object_type=object_type,
-            species=species,
-        ),
-        response_format=response_format,
-        json={"ids": id},
-    )
-
-
-@singledispatch
-def symbol_lookup(symbol: str, species: str, callback=None, expand=None, format=None, response_format="json"):
-    return get(
-        f"lookup/symbol/{species}/{symbol}",
-        params=dict(callback=callback, expand=expand,
-                    response_format=response_format),
-        response_format=response_format,
-    )
-
-
-@symbol_lookup.register
-def _(symbol: list, species: str, callback=None, expand=None, format=None, response_format="json"):
-    return post(
-        f"lookup/symbol/{species}",
-        params=dict(callback=callback, expand=expand,
-                    response_format=response_format),
-        response_format=response_format,
-        json={"symbols": symbol},
-    )
-
-
-def assembly_cdna(
-        id: str, region: str, callback=None, include_original_region=None, species=None, response_format="json"):
-    return get(
-        f"map/cdna/{id}/{region}",
-        params=dict(
-            callback=callback,
-            include_original_region=include_original_region,
-            species=species,
-        ),
-        response_format=response_format,
-    )
-
-
-def assembly_cds(
-        id: str, region: str, callback=None, include_original_region=None, species=None, response_format="json"):
-    return get(
-        f"map/cds/{id}/{region}",
-        params=dict(
-            callback=callback,
-            include_original_region=include_original_region,
-            species=species,
-        ),
-        response_format=response_format,
-    )
-
-
-def assembly_map(
-        asm_one: str,
-        asm_two: str,
-        region: str,
-        species: str,
-        callback=None,
-        coord_system=None,
-        target_coord_system=None, response_format="json"):
-    return get(
-        f"map/{species}/{asm_one}/{region}/{asm_two}",
-        params=dict(
-            callback=callback,
-            coord_system=coord_system,
-            target_coord_system=target_coord_system,
-        ),
-        response_format=response_format,
-    )
-
-
-def assembly_translation(id: str, region: str, callback=None, species=None, response_format="json"):
-    return get(
-        f"map/translation/{id}/{region}",
-        params=dict(callback=callback, species=species),
-        response_format=response_format,
-    )
-
-
-def ontology_ancestors(id: str, callback=None, ontology=None, response_format="json"):
-    return get(
-        f"ontology/ancestors/{id}",
-        params=dict(callback=callback, ontology=ontology),
-        response_format=response_format,
-    )
-
-
-def ontology_ancestors_chart(id: str, callback=None, ontology=None, response_format="json"):
-    return get(
-        f"ontology/ancestors/chart/{id}",
-        params=dict(callback=callback, ontology=ontology),
-        response_format=response_format,
-    )
-
-
-def ontology_descendants(
-        id: str,
-        callback=None,
-        closest_term=None,
-        ontology=None,
-        subset=None,
-        zero_distance=None,
-        response_format="json"):
-    return get(
-        f"ontology/descendants/{id}",
-        params=dict(
-            callback=callback,
-            closest_term=closest_term,
-            ontology=ontology,
-            subset=subset,
-            zero_distance=zero_distance,
-        ),
-        response_format=response_format,
-    )
-
-
-def ontology_id(id: str, callback=None, relation=None, simple=None, response_format="json"):
-    return get(
-        f"ontology/id/{id}",
-        params=dict(callback=callback, relation=relation, simple=simple),
-        response_format=response_format,
-    )
-
-
-def ontology_name(name: str, callback=None, ontology=None, relation=None, simple=None, response_format="json"):
-    return get(
-        f"ontology/name/{name}",
-        params=dict(
-            callback=callback, ontology=ontology, relation=relation, simple=simple
-        ),
-        response_format=response_format,
-    )
-
-
-def taxonomy_classification(id: str, callback=None, response_format="json"):
-    return get(
-        f"taxonomy/classification/{id}", params=dict(callback=callback), response_format=response_format
-    )
-
-
-def taxonomy_id(id: str, callback=None, simple=None, response_format="json"):
-    return get(
-        f"taxonomy/id/{id}",
-        params=dict(callback=callback, simple=simple),
-        response_format=response_format,
-    )
-
-
-def taxonomy_name(name: str, callback=None, response_format="json"):
-    return get(f"taxonomy/name/{name}", params=dict(callback=callback), response_format=response_format)
-
-
-def overlap_id(
-        id: str,
-        feature: str,
-        biotype=None,
-        callback=None,
-        db_type=None,
-        logic_name=None,
-        misc_set=None,
-        object_type=None,
-        so_term=None,
-        species=None,
-        species_set=None,
-        variant_set=None,
-        response_format="json"):
-    return get(
-        f"overlap/id/{id}",
-        params=dict(
-            feature=feature,
-            biotype=biotype,
-            callback=callback,
-            db_type=db_type,
-            logic_name=logic_name,
-            misc_set=misc_set,
-            object_type=object_type,
-            so_term=so_term,
-            species=species,
-            species_set=species_set,
-            variant_set=variant_set,
-        ),
-        response_format=response_format,
-    )
-
-
-def overlap_region(
-        species: str,
-        region: str,
-        feature: str,
-        biotype=None,
-        callback=None,
-        db_type=None,
-        logic_name=None,
-        misc_set=None,
-        so_term=None,
-        species_set=None,
-        trim_downstream=None,
-        trim_upstream=None,
-        variant_set=None,
-        response_format="json"):
-    return get(
-        f"overlap/region/{species}/{region}",
-        params=dict(
-            feature=feature,
-            biotype=biotype,
-            callback=callback,
-            db_type=db_type,
-            logic_name=logic_name,
-            misc_set=misc_set,
-            so_term=so_term,
-            species_set=species_set,
-            trim_downstream=trim_downstream,
-            trim_upstream=trim_upstream,
-            variant_set=variant_set,
-        ),
-        response_format=response_format,
-    )
-
-
-def overlap_translation(
-        id: str,
-        callback=None,
-        db_type=None,
-        feature=None,
-        so_term=None,
-        species=None,
-        type=None,
-        response_format="json"):
-    return get(
-        f"overlap/translation/{id}",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            feature=feature,
-            so_term=so_term,
-            species=species,
-            type=type,
-        ),
-        response_format=response_format,
-    )
-
-
-def phenotype_accession(
-        species: str,
-        accession: str,
-        callback=None,
-        include_children=None,
-        include_pubmed_id=None,
-        include_review_status=None,
-        source=None,
-        response_format="json"):
-    return get(
-        f"/phenotype/accession/{species}/{accession}",
-        params=dict(
-            callback=callback,
-            include_children=include_children,
-            include_pubmed_id=include_pubmed_id,
-            include_review_status=include_review_status,
-            source=source,
-        ),
-        response_format=response_format,
-    )
-
-
-def phenotype_gene(
-        species: str,
-        gene: str,
-        callback=None,
-        include_associated=None,
-        include_overlap=None,
-        include_pubmed_id=None,
-        include_review_status=None,
-        include_submitter=None,
-        non_specified=None,
-        trait=None,
-        tumour=None,
-        response_format="json"):
-    return get(
-        f"/phenotype/gene/{species}/{gene}",
-        params=dict(
-            callback=callback,
-            include_associated=include_associated,
-            include_overlap=include_overlap,
-            include_pubmed_id=include_pubmed_id,
-            include_review_status=include_review_status,
-            include_submitter=include_submitter,
-            non_specified=non_specified,
-            trait=trait,
-            tumour=tumour,
-        ),
-        response_format=response_format,
-    )
-
-
-def phenotype_region(
-        species: str,
-        region: str,
-        callback=None,
-        feature_type=None,
-        include_pubmed_id=None,
-        include_review_status=None,
-        include_submitter=None,
-        non_specified=None,
-        only_phenotypes=None,
-        trait=None,
-        tumour=None,
-        response_format="json"):
-    return get(
-        f"/phenotype/region/{species}/{region}",
-        params=dict(
-            callback=callback,
-            feature_type=feature_type,
-            include_pubmed_id=include_pubmed_id,
-            include_review_status=include_review_status,
-            include_submitter=include_submitter,
-            non_specified=non_specified,
-            only_phenotypes=only_phenotypes,
-            trait=trait,
-            tumour=tumour,
-        ),
-        response_format=response_format,
-    )
-
-
-def phenotype_term(
-        species: str,
-        term: str,
-        callback=None,
-        include_children=None,
-        include_pubmed_id=None,
-        include_review_status=None,
-        source=None,
-        response_format="json"):
-    return get(
-        f"/phenotype/term/{species}/{term}",
-        params=dict(
-            callback=callback,
-            include_children=include_children,
-            include_pubmed_id=include_pubmed_id,
-            include_review_status=include_review_status,
-            source=source,
-        ),
-        response_format=response_format,
-    )
-
-
-def array(species: str, microarray: str, vendor: str, callback=None, response_format="json"):
-    return get(
-        f"regulatory/species/{species}/microarray/{microarray}/vendor/{vendor}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def fetch_all_epigenomes(species: str, callback=None, response_format="json"):
-    return get(
-        f"regulatory/species/{species}/epigenome",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def get_binding_matrix(species: str, binding_matrix: str, callback=None, unit=None, response_format="json"):
-    return get(
-        f"species/{species}/binding_matrix/{binding_matrix}/",
-        params=dict(callback=callback, unit=unit),
-        response_format=response_format,
-    )
-
-
-def list_all_microarrays(species: str, callback=None, response_format="json"):
-    return get(
-        f"regulatory/species/{species}/microarray",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def probe(
-        species: str,
-        microarray: str,
-        probe: str,
-        callback=None,
-        gene=None,
-        transcripts=None,
-        response_format="json"):
-    return get(
-        f"regulatory/species/{species}/microarray/{microarray}/probe/{probe}",
-        params=dict(callback=callback, gene=gene, transcripts=transcripts),
-        response_format=response_format,
-    )
-
-
-def probe_set(
-        species: str,
-        microarray: str,
-        probe_set: str,
-        callback=None,
-        gene=None,
-        transcripts=None,
-        response_format="json"):
-    return get(
-        f"regulatory/species/{species}/microarray/{
-            microarray}/probe_set/{probe_set}",
-        params=dict(callback=callback, gene=gene, transcripts=transcripts),
-        response_format=response_format,
-    )
-
-
-def regulatory_id(species: str, id: str, activity=None, callback=None, response_format="json"):
-    return get(
-        f"regulatory/species/{species}/id/{id}",
-        params=dict(activity=activity, callback=callback),
-        response_format=response_format,
-    )
-
-
-@singledispatch
-def sequence_id(
-        id: str,
-        callback=None,
-        db_type=None,
-        end=None,
-        expand_3prime=None,
-        expand_5prime=None,
-        format=None,
-        mask=None,
-        mask_feature=None,
-        multiple_sequences=None,
-        object_type=None,
-        species=None,
-        start=None,
-        type=None,
-        response_format="json"):
-    return get(
-        f"sequence/id/{id}",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            end=end,
-            expand_3prime=expand_3prime,
-            expand_5prime=expand_5prime,
-            response_format=response_format,
-            mask=mask,
-            mask_feature=mask_feature,
-            multiple_sequences=multiple_sequences,
-            object_type=object_type,
-            species=species,
-            start=start,
-            type=type,
-        ),
-        response_format=response_format,
-    )
-
-
-@sequence_id.register
-def _(
-        id: list,
-        callback=None,
-        db_type=None,
-        end=None,
-        expand_3prime=None,
-        expand_5prime=None,
-        format=None,
-        mask=None,
-        mask_feature=None,
-        object_type=None,
-        species=None,
-        start=None,
-        type=None,
-        response_format="json"):
-    return post(
-        f"sequence/id",
-        params=dict(
-            callback=callback,
-            db_type=db_type,
-            end=end,
-            expand_3prime=expand_3prime,
-            expand_5prime=expand_5prime,
-            response_format=response_format,
-            mask=mask,
-            mask_feature=mask_feature,
-            object_type=object_type,
-            species=species,
-            start=start,
-            type=type,
-        ),
-        response_format=response_format,
-        json={"ids": id},
-    )
-
-
-@singledispatch
-def sequence_region(
-        region: str,
-        species: str,
-        callback=None,
-        coord_system=None,
-        coord_system_version=None,
-        expand_3prime=None,
-        expand_5prime=None,
-        format=None,
-        mask=None,
-        mask_feature=None,
-        response_format="json"):
-    return get(
-        f"sequence/region/{species}/{region}",
-        params=dict(
-            callback=callback,
-            coord_system=coord_system,
-            coord_system_version=coord_system_version,
-            expand_3prime=expand_3prime,
-            expand_5prime=expand_5prime,
-            response_format=response_format,
-            mask=mask,
-            mask_feature=mask_feature,
-        ),
-        response_format=response_format,
-    )
-
-
-@sequence_region.register
-def _(
-        region: list,
-        species: str,
-        callback=None,
-        coord_system=None,
-        coord_system_version=None,
-        expand_3prime=None,
-        expand_5prime=None,
-        format=None,
-        mask=None,
-        mask_feature=None,
-        response_format="json"):
-    return post(
-        f"sequence/region/{species}",
-        params=dict(
-            callback=callback,
-            coord_system=coord_system,
-            coord_system_version=coord_system_version,
-            expand_3prime=expand_3prime,
-            expand_5prime=expand_5prime,
-            format=format,
-            mask=mask,
-            mask_feature=mask_feature,
-        ),
-        response_format=response_format,
-        json={"regions": region},
-    )
-
-
-def transcript_haplotypes_get(
-        id: str,
-        species: str,
-        aligned_sequences=None,
-        callback=None,
-        samples=None,
-        sequence=None,
-        response_format="json"):
-    return get(
-        f"transcript_haplotypes/{species}/{id}",
-        params=dict(
-            aligned_sequences=aligned_sequences,
-            callback=callback,
-            samples=samples,
-            sequence=sequence,
-        ),
-        response_format=response_format,
-    )
-
-
-@singledispatch
-def vep_hgvs(
-        hgvs_notation: str,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        Conservation=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        ambiguous_hgvs=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return get(
-        f"vep/{species}/hgvs/{hgvs_notation}",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            Conservation=Conservation,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            ambiguous_hgvs=ambiguous_hgvs,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-    )
-
-
-@vep_hgvs.register
-def _(
-        hgvs_notation: list,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        ambiguous_hgvs=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return post(
-        f"vep/{species}/hgvs",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            ambiguous_hgvs=ambiguous_hgvs,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-        json={"hgvs_notations": hgvs_notation},
-    )
-
-
-@singledispatch
-def vep_id(
-        id: str,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        Conservation=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return get(
-        f"vep/{species}/id/{id}",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            Conservation=Conservation,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-    )
-
-
-@vep_id.register
-def _(
-        id: list,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return post(
-        f"vep/{species}/id",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-        json={"ids": id},
-    )
-
-
-@singledispatch
-def vep_region(
-        region: str,
-        allele: str,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        Conservation=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return get(
-        f"vep/{species}/region/{region}/{allele}/",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            Conservation=Conservation,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-    )
-
-
-@vep_region.register
-def _(
-        region: list,
-        species: str,
-        AncestralAllele=None,
-        Blosum62=None,
-        CADD=None,
-        DisGeNET=None,
-        EVE=None,
-        GO=None,
-        GeneSplicer=None,
-        Geno2MP=None,
-        IntAct=None,
-        LoF=None,
-        Mastermind=None,
-        MaveDB=None,
-        MaxEntScan=None,
-        NMD=None,
-        Phenotypes=None,
-        SpliceAI=None,
-        UTRAnnotator=None,
-        appris=None,
-        callback=None,
-        canonical=None,
-        ccds=None,
-        dbNSFP=None,
-        dbscSNV=None,
-        distance=None,
-        domains=None,
-        failed=None,
-        flag_pick=None,
-        flag_pick_allele=None,
-        flag_pick_allele_gene=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        hgvs=None,
-        mane=None,
-        merged=None,
-        minimal=None,
-        mirna=None,
-        mutfunc=None,
-        numbers=None,
-        per_gene=None,
-        pick=None,
-        pick_allele=None,
-        pick_allele_gene=None,
-        pick_order=None,
-        protein=None,
-        refseq=None,
-        shift_3prime=None,
-        shift_genomic=None,
-        transcript_id=None,
-        transcript_version=None,
-        tsl=None,
-        uniprot=None,
-        variant_class=None,
-        vcf_string=None,
-        xref_refseq=None,
-        response_format="json"):
-    return post(
-        f"vep/{species}/region",
-        params=dict(
-            AncestralAllele=AncestralAllele,
-            Blosum62=Blosum62,
-            CADD=CADD,
-            DisGeNET=DisGeNET,
-            EVE=EVE,
-            GO=GO,
-            GeneSplicer=GeneSplicer,
-            Geno2MP=Geno2MP,
-            IntAct=IntAct,
-            LoF=LoF,
-            Mastermind=Mastermind,
-            MaveDB=MaveDB,
-            MaxEntScan=MaxEntScan,
-            NMD=NMD,
-            Phenotypes=Phenotypes,
-            SpliceAI=SpliceAI,
-            UTRAnnotator=UTRAnnotator,
-            appris=appris,
-            callback=callback,
-            canonical=canonical,
-            ccds=ccds,
-            dbNSFP=dbNSFP,
-            dbscSNV=dbscSNV,
-            distance=distance,
-            domains=domains,
-            failed=failed,
-            flag_pick=flag_pick,
-            flag_pick_allele=flag_pick_allele,
-            flag_pick_allele_gene=flag_pick_allele_gene,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            hgvs=hgvs,
-            mane=mane,
-            merged=merged,
-            minimal=minimal,
-            mirna=mirna,
-            mutfunc=mutfunc,
-            numbers=numbers,
-            per_gene=per_gene,
-            pick=pick,
-            pick_allele=pick_allele,
-            pick_allele_gene=pick_allele_gene,
-            pick_order=pick_order,
-            protein=protein,
-            refseq=refseq,
-            shift_3prime=shift_3prime,
-            shift_genomic=shift_genomic,
-            transcript_id=transcript_id,
-            transcript_version=transcript_version,
-            tsl=tsl,
-            uniprot=uniprot,
-            variant_class=variant_class,
-            vcf_string=vcf_string,
-            xref_refseq=xref_refseq,
-        ),
-        response_format=response_format,
-        json={"variants": region},
-    )
-
-
-@singledispatch
-def variant_recoder(
-        id: str,
-        species: str,
-        callback=None,
-        failed=None,
-        fields=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        minimal=None,
-        var_synonyms=None,
-        vcf_string=None,
-        response_format="json"):
-    return get(
-        f"variant_recoder/{species}/{id}",
-        params=dict(
-            callback=callback,
-            failed=failed,
-            fields=fields,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            minimal=minimal,
-            var_synonyms=var_synonyms,
-            vcf_string=vcf_string,
-        ),
-        response_format=response_format,
-    )
-
-
-@variant_recoder.register
-def _(
-        id: list,
-        species: str,
-        callback=None,
-        failed=None,
-        fields=None,
-        ga4gh_vrs=None,
-        gencode_basic=None,
-        minimal=None,
-        var_synonyms=None,
-        vcf_string=None,
-        response_format="json"):
-    return post(
-        f"variant_recoder/{species}",
-        params=dict(
-            callback=callback,
-            failed=failed,
-            fields=fields,
-            ga4gh_vrs=ga4gh_vrs,
-            gencode_basic=gencode_basic,
-            minimal=minimal,
-            var_synonyms=var_synonyms,
-            vcf_string=vcf_string,
-        ),
-        response_format=response_format,
-        json={"ids": id},
-    )
-
-
-@singledispatch
-def variation_id(
-        id: str,
-        species: str,
-        callback=None,
-        genotypes=None,
-        genotyping_chips=None,
-        phenotypes=None,
-        pops=None,
-        population_genotypes=None,
-        response_format="json"):
-    return get(
-        f"variation/{species}/{id}",
-        params=dict(
-            callback=callback,
-            genotypes=genotypes,
-            genotyping_chips=genotyping_chips,
-            phenotypes=phenotypes,
-            pops=pops,
-            population_genotypes=population_genotypes,
-        ),
-        response_format=response_format,
-    )
-
-
-@variation_id.register
-def _(
-        id: list,
-        species: str,
-        callback=None,
-        genotypes=None,
-        phenotypes=None,
-        pops=None,
-        population_genotypes=None,
-        response_format="json"):
-    return post(
-        f"variation/{species}/",
-        params=dict(
-            callback=callback,
-            genotypes=genotypes,
-            phenotypes=phenotypes,
-            pops=pops,
-            population_genotypes=population_genotypes,
-        ),
-        response_format=response_format,
-        json={"ids": id},
-    )
-
-
-def variation_pmcid_get(pmcid: str, species: str, callback=None, response_format="json"):
-    return get(
-        f"variation/{species}/pmcid/{pmcid}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def variation_pmid_get(pmid: str, species: str, callback=None, response_format="json"):
-    return get(
-        f"variation/{species}/pmid/{pmid}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def beacon_get(callback=None, response_format="json"):
-    return get(f"ga4gh/beacon", params=dict(callback=callback), response_format=response_format)
-
-
-def beacon_query_get(response_format="json", **kwargs,):
-    return get(f"ga4gh/beacon/query", params=dict(**kwargs), response_format=response_format)
-
-
-def beacon_query_post(response_format="json", **kwargs):
-    return post(f"ga4gh/beacon/query", params={}, response_format=response_format, json=dict(**kwargs))
-
-
-def features_id(id: str, callback=None, response_format="json"):
-    return get(f"ga4gh/features/{id}", params=dict(callback=callback), response_format=response_format)
-
-
-def features_post(response_format="json", **kwargs):
-    return post(f"ga4gh/features/search", params={}, response_format=response_format, json=dict(**kwargs))
-
-
-def gacallSet(response_format="json", **kwargs):
-    return post(f"ga4gh/callsets/search",
-                params={}, response_format=response_format, json=dict(**kwargs))
-
-
-def gacallset_id(id: str, callback=None, response_format="json"):
-    return get(f"ga4gh/callsets/{id}", params=dict(callback=callback), response_format=response_format)
-
-
-def gadataset(callback=None, pageSize=None, pageToken=None, response_format="json"):
-    return post(
-        f"ga4gh/datasets/search",
-        params=dict(callback=callback), json=dict(pageSize=pageSize, pageToken=pageToken),
-        response_format=response_format,
-    )
-
-
-def gadataset_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/datasets/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def gafeatureset(
-    datasetId: str, callback=None, pageSize=None, pageToken=None, response_format="json"
-):
-    return post(
-        f"ga4gh/featuresets/search",
-        params=dict(callback=callback), json=dict(datasetId=datasetId, pageSize=pageSize, pageToken=pageToken),
-        response_format=response_format,
-    )
-
-
-def gafeatureset_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/featuresets/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def gavariant_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/variants/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def gavariantannotations(
-    variantAnnotationSetId: str,
-    callback=None,
-    effects=None,
-    end=None,
-    pageSize=None,
-    pageToken=None,
-    referenceId=None,
-    referenceName=None,
-    start=None,
-    response_format="json",
-):
-    return post(
-        f"ga4gh/variantannotations/search",
-        params=dict(
-            callback=callback),
-        json=dict(variantAnnotationSetId=variantAnnotationSetId,
-                  effects=effects,
-                  end=end,
-                  pageSize=pageSize,
-                  pageToken=pageToken,
-                  referenceId=referenceId,
-                  referenceName=referenceName,
-                  start=start,
-                  ),
-        response_format=response_format,
-    )
-
-
-def gavariants(
-    end: str,
-    referenceName: str,
-    start: str,
-    variantSetId: str,
-    callSetIds=None,
-    callback=None,
-    pageSize=None,
-    pageToken=None,
-    response_format="json",
-):
-    return post(
-        f"ga4gh/variants/search",
-        params=dict(callback=callback),
-        json=dict(
-            pageSize=pageSize,
-            pageToken=pageToken,
-            callSetIds=callSetIds,
-            end=end,
-            referenceName=referenceName,
-            start=start,
-            variantSetId=variantSetId,
-        ),
-        response_format=response_format,
-    )
-
-
-def gavariantset(
-    datasetId: str, callback=None, pageSize=None, pageToken=None, response_format="json"
-):
-    return post(
-        f"ga4gh/variantsets/search",
-        params=dict(callback=callback), json=dict(datasetId=datasetId, pageSize=pageSize, pageToken=pageToken),
-        response_format=response_format,
-    )
-
-
-def gavariantset_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/variantsets/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def references(
-    referenceSetId: str,
-    accession=None,
-    callback=None,
-    md5checksum=None,
-    pageSize=None,
-    pageToken=None,
-    response_format="json",
-):
-    return post(
-        f"ga4gh/references/search",
-        params=dict(callback=callback),
-        json=dict(accession=accession,
-                  referenceSetId=referenceSetId,
-                  md5checksum=md5checksum,
-                  pageSize=pageSize,
-                  pageToken=pageToken,
-                  ),
-        response_format=response_format,
-    )
-
-
-def references_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/references/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def referenceSets(
-    accession=None, callback=None, pageSize=None, pageToken=None, response_format="json"
-):
-    return post(
-        f"ga4gh/referencesets/search",
-        params=dict(
-
-            callback=callback),
-        json=dict(accession=accession,
-                  pageSize=pageSize,
-                  pageToken=pageToken,
-                  ),
-        response_format=response_format,
-    )
-
-
-def referenceSets_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/referencesets/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
-
-def VariantAnnotationSet(
-    variantSetId: str,
-    callback=None,
-    pageSize=None,
-    pageToken=None,
-    response_format="json",
-):
-    return post(
-        f"ga4gh/variantannotationsets/search",
-        params=dict(callback=callback), json=dict(variantSetId=variantSetId, pageSize=pageSize, pageToken=pageToken),
-        response_format=response_format,
-    )
-
-
-def VariantAnnotationSet_id(id: str, callback=None, response_format="json"):
-    return get(
-        f"ga4gh/variantannotationsets/{id}",
-        params=dict(callback=callback),
-        response_format=response_format,
-    )
-
+def run(coroutine):
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_run_and_close(coroutine))
+    return uvloop.run(_run_and_close(coroutine))
+
+
+_BATCH_FIELDS = {"sequence_id": "query", "variant_recoder": "input", "vep_hgvs": "input", "vep_id": "input"}
+
+
+def _batch_key(name, entry):
+    if name == "variant_recoder":
+        entry = next((v for v in entry.values() if isinstance(v, dict) and "input" in v), {})
+    return entry.get(_BATCH_FIELDS.get(name, "id"))
+
+
+class BatchingProxy:
+    max_batch = 1000
 
-class Ensembl:
     def __init__(self):
+        self._queue = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def lookup(self, id: str, **kwargs):
+        return self._submit("lookup", id, kwargs)
+
+    def archive_id(self, id: str, **kwargs):
+        return self._submit("archive_id", id, kwargs)
+
+    def symbol_lookup(self, symbol: str, species: str, **kwargs):
+        return self._submit("symbol_lookup", symbol, dict(kwargs, species=species))
+
+    def sequence_id(self, id: str, **kwargs):
+        return self._submit("sequence_id", id, kwargs)
+
+    def variant_recoder(self, id: str, species: str, **kwargs):
+        return self._submit("variant_recoder", id, dict(kwargs, species=species))
+
+    def variation_id(self, id: str, species: str, **kwargs):
+        return self._submit("variation_id", id, dict(kwargs, species=species))
+
+    def vep_hgvs(self, hgvs_notation: str, species: str, **kwargs):
+        return self._submit("vep_hgvs", hgvs_notation, dict(kwargs, species=species))
+
+    def vep_id(self, id: str, species: str, **kwargs):
+        return self._submit("vep_id", id, dict(kwargs, species=species))
+
+    def _submit(self, name, key, kwargs):
+        future = Future()
+        self._queue.append((globals()[name], key, kwargs, future))
+        if len(self._queue) >= self.max_batch:
+            self.flush()
+        return future
+
+    def flush(self):
+        queue, self._queue = self._queue, []
+        groups = {}
+        for fn, key, kwargs, future in queue:
+            groups.setdefault((fn, tuple(sorted(kwargs.items()))), []).append((key, future))
+        for (fn, kwargs), entries in groups.items():
+            size = min(self.max_batch, _post_cap(fn.__name__))
+            for i in range(0, len(entries), size):
+                chunk = entries[i:i + size]
+                try:
+                    response = fn([key for key, _ in chunk], **dict(kwargs))
+                except Exception as e:
+                    for _, future in chunk:
+                        future.set_exception(e)
+                    continue
+                if isinstance(response, list):
+                    response = {_batch_key(fn.__name__, entry): entry for entry in response}
+                for key, future in chunk:
+                    future.set_result(response.get(key))
+        return [future.result() for *_, future in queue]
+
+
+def batch():
+    return BatchingProxy()
+
+
+class Ensembl:
+    __slots__ = ("server", "session", "transport", "timeout", "vep_batch_size", "_memoized")
+
+    def __init__(self, cache=False, transport="requests", timeout=None):
         self.server = "https://rest.ensembl.org/"
-        self.session = requests.Session()
-        self.adapter = HTTPAdapter(
-            max_retries=Retry(
-                backoff_factor=3600 / 55000,
-                respect_retry_after_header=True,
-                status_forcelist=[429],
-                allowed_methods=["GET", "POST"],
-            )
-        )
-        self.session.mount(self.server, self.adapter)
-
-    def get(self, endpoint, params, response_format):
-        headers = {}
-        headers["Content-Type"] = media_type[response_format]
-        response = self.session.get(
-            urljoin(self.server, endpoint), headers=headers, params=params
-        )
-        if response.ok:
-            if headers["Content-Type"] == "application/json":
-                return response.json()
-            else:
-                return response.text
-        else:
-            response.raise_for_status()
-
-    def post(self, endpoint, params, json, response_format):
-        headers = {}
-        headers["Content-Type"] = media_type[response_format]
-        headers["Accept"] = media_type[response_format]
-        response = self.session.post(
-            urljoin(self.server, endpoint), headers=headers, params=params, json=json
-        )
-        if response.ok:
-            if headers["Accept"] == "application/json":
-                return response.json()
-            else:
-                return response.text
-        else:
-            response.raise_for_status()
-
-    @singledispatchmethod
-    def archive(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"archive/id/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    @archive.register
-    def _(self, id: list, callback=None, response_format="json"):
-        return self.post(
-            f"archive/id",
-            params=dict(callback=callback),
-            response_format=response_format,
-            json=dict(id=id),
-        )
-
-    def cafe_tree(self, id: str, callback=None, compara=None, nh_response_format=None, response_format="json"):
-        return self.get(
-            f"cafe/genetree/id/{id}",
-            params=dict(callback=callback, compara=compara,
-                        nh_response_format=nh_response_format),
-            response_format=response_format,
-        )
-
-    def cafe_tree_member_id(self,
-                            id: str,
-                            callback=None,
-                            compara=None,
-                            db_type=None,
-                            nh_response_format=None,
-                            object_type=None,
-                            species=None,
-                            response_format="json"):
-        return self.get(
-            f"cafe/genetree/member/id/{id}",
-            params=dict(
-                callback=callback,
-                compara=compara,
-                db_type=db_type,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-                species=species,
-            ),
-            response_format=response_format,
-        )
-
-    def cafe_tree_member_symbol(self,
-                                species: str,
-                                symbol: str,
-                                callback=None,
-                                compara=None,
-                                db_type=None,
-                                external_db=None,
-                                nh_response_format=None,
-                                object_type=None,
-                                response_format="json"):
-        return self.get(
-            f"cafe/genetree/member/symbol/{species}/{symbol}",
-            params=dict(
-                callback=callback,
-                compara=compara,
-                db_type=db_type,
-                external_db=external_db,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-            ),
-            response_format=response_format,
-        )
-
-    def cafe_tree_species_member_id(self,
-                                    id: str,
-                                    species: str,
-                                    callback=None,
-                                    compara=None,
-                                    db_type=None,
-                                    nh_response_format=None,
-                                    object_type=None,
-                                    response_format="json"):
-        return self.get(
-            f"cafe/genetree/member/id/{species}/{id}",
-            params=dict(
-                callback=callback,
-                compara=compara,
-                db_type=db_type,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-            ),
-            response_format=response_format,
-        )
-
-    def genetree(self,
-                 id: str,
-                 aligned=None,
-                 callback=None,
-                 cigar_line=None,
-                 clusterset_id=None,
-                 compara=None,
-                 nh_response_format=None,
-                 prune_species=None,
-                 prune_taxon=None,
-                 sequence=None,
-                 response_format="json"):
-        return self.get(
-            f"genetree/id/{id}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                clusterset_id=clusterset_id,
-                compara=compara,
-                nh_response_format=nh_response_format,
-                prune_species=prune_species,
-                prune_taxon=prune_taxon,
-                sequence=sequence,
-            ),
-            response_format=response_format,
-        )
-
-    def genetree_member_id(self,
-                           id: str,
-                           aligned=None,
-                           callback=None,
-                           cigar_line=None,
-                           clusterset_id=None,
-                           compara=None,
-                           db_type=None,
-                           nh_response_format=None,
-                           object_type=None,
-                           prune_species=None,
-                           prune_taxon=None,
-                           sequence=None,
-                           species=None,
-                           response_format="json"):
-        return self.get(
-            f"genetree/member/id/{id}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                clusterset_id=clusterset_id,
-                compara=compara,
-                db_type=db_type,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-                prune_species=prune_species,
-                prune_taxon=prune_taxon,
-                sequence=sequence,
-                species=species,
-            ),
-            response_format=response_format,
-        )
-
-    def genetree_member_symbol(self,
-                               species: str,
-                               symbol: str,
-                               aligned=None,
-                               callback=None,
-                               cigar_line=None,
-                               clusterset_id=None,
-                               compara=None,
-                               db_type=None,
-                               external_db=None,
-                               nh_response_format=None,
-                               object_type=None,
-                               prune_species=None,
-                               prune_taxon=None,
-                               sequence=None,
-                               response_format="json"):
-        return self.get(
-            f"genetree/member/symbol/{species}/{symbol}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                clusterset_id=clusterset_id,
-                compara=compara,
-                db_type=db_type,
-                external_db=external_db,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-                prune_species=prune_species,
-                prune_taxon=prune_taxon,
-                sequence=sequence,
-            ),
-            response_format=response_format,
-        )
-
-    def genetree_species_member_id(self,
-                                   id: str,
-                                   species: str,
-                                   aligned=None,
-                                   callback=None,
-                                   cigar_line=None,
-                                   clusterset_id=None,
-                                   compara=None,
-                                   db_type=None,
-                                   nh_response_format=None,
-                                   object_type=None,
-                                   prune_species=None,
-                                   prune_taxon=None,
-                                   sequence=None,
-                                   response_format="json"):
-        return self.get(
-            f"genetree/member/id/{species}/{id}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                clusterset_id=clusterset_id,
-                compara=compara,
-                db_type=db_type,
-                nh_response_format=nh_response_format,
-                object_type=object_type,
-                prune_species=prune_species,
-                prune_taxon=prune_taxon,
-                sequence=sequence,
-            ),
-            response_format=response_format,
-        )
-
-    def genomic_alignment_region(self,
-                                 region: str,
-                                 species: str,
-                                 aligned=None,
-                                 callback=None,
-                                 compact=None,
-                                 compara=None,
-                                 display_species_set=None,
-                                 mask=None,
-                                 method=None,
-                                 species_set=None,
-                                 species_set_group=None,
-                                 response_format="json"):
-        return self.get(
-            f"alignment/region/{species}/{region}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                compact=compact,
-                compara=compara,
-                display_species_set=display_species_set,
-                mask=mask,
-                method=method,
-                species_set=species_set,
-                species_set_group=species_set_group,
-            ),
-            response_format=response_format,
-        )
-
-    def homology_ensemblgene(self,
-                             id: str,
-                             aligned=None,
-                             callback=None,
-                             cigar_line=None,
-                             compara=None,
-                             format=None,
-                             sequence=None,
-                             target_species=None,
-                             target_taxon=None,
-                             type=None,
-                             response_format="json"):
-        return self.get(
-            f"homology/id/{id}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                compara=compara,
-                response_format=response_format,
-                sequence=sequence,
-                target_species=target_species,
-                target_taxon=target_taxon,
-                type=type,
-            ),
-            response_format=response_format,
-        )
-
-    def homology_species_gene_id(self,
-                                 id: str,
-                                 species: str,
-                                 aligned=None,
-                                 callback=None,
-                                 cigar_line=None,
-                                 compara=None,
-                                 format=None,
-                                 sequence=None,
-                                 target_species=None,
-                                 target_taxon=None,
-                                 type=None,
-                                 response_format="json"):
-        return self.get(
-            f"homology/id/{species}/{id}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                compara=compara,
-                response_format=response_format,
-                sequence=sequence,
-                target_species=target_species,
-                target_taxon=target_taxon,
-                type=type,
-            ),
-            response_format=response_format,
-        )
-
-    def homology_symbol(self,
-                        species: str,
-                        symbol: str,
-                        aligned=None,
-                        callback=None,
-                        cigar_line=None,
-                        compara=None,
-                        external_db=None,
-                        format=None,
-                        sequence=None,
-                        target_species=None,
-                        target_taxon=None,
-                        type=None,
-                        response_format="json"):
-        return self.get(
-            f"homology/symbol/{species}/{symbol}",
-            params=dict(
-                aligned=aligned,
-                callback=callback,
-                cigar_line=cigar_line,
-                compara=compara,
-                external_db=external_db,
-                response_format=response_format,
-                sequence=sequence,
-                target_species=target_species,
-                target_taxon=target_taxon,
-                type=type,
-            ),
-            response_format=response_format,
-        )
-
-    def xref_external(self,
-                      species: str,
-                      symbol: str,
-                      callback=None,
-                      db_type=None,
-                      external_db=None,
-                      object_type=None,
-                      response_format="json"):
-        return self.get(
-            f"xrefs/symbol/{species}/{symbol}",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                external_db=external_db,
-                object_type=object_type,
-            ),
-            response_format=response_format,
-        )
-
-    def xref_id(self,
-                id: str,
-                all_levels=None,
-                callback=None,
-                db_type=None,
-                external_db=None,
-                object_type=None,
-                species=None,
-                response_format="json"):
-        return self.get(
-            f"xrefs/id/{id}",
-            params=dict(
-                all_levels=all_levels,
-                callback=callback,
-                db_type=db_type,
-                external_db=external_db,
-                object_type=object_type,
-                species=species,
-            ),
-            response_format=response_format,
-        )
-
-    def xref_name(self, name: str, species: str, callback=None, db_type=None, external_db=None, response_format="json"):
-        return self.get(
-            f"xrefs/name/{species}/{name}",
-            params=dict(callback=callback, db_type=db_type,
-                        external_db=external_db),
-            response_format=response_format,
-        )
-
-    def analysis(self, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"info/analysis/{species}", params=dict(callback=callback), response_format=response_format
-        )
-
-    def assembly_info(self, species: str, bands=None, callback=None, synonyms=None, response_format="json"):
-        return self.get(
-            f"info/assembly/{species}",
-            params=dict(bands=bands, callback=callback, synonyms=synonyms),
-            response_format=response_format,
-        )
-
-    def assembly_stats(self,
-                       region_name: str, species: str, bands=None, callback=None, synonyms=None, response_format="json"):
-        return self.get(
-            f"info/assembly/{species}/{region_name}",
-            params=dict(bands=bands, callback=callback, synonyms=synonyms),
-            response_format=response_format,
-        )
-
-    def biotypes(self, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"info/biotypes/{species}", params=dict(callback=callback), response_format=response_format
-        )
-
-    def biotypes_groups(self, callback=None, group=None, object_type=None, response_format="json"):
-        return self.get(
-            f"info/biotypes/groups/{group}/{object_type}",
-            params=dict(callback=callback, group=group,
-                        object_type=object_type),
-            response_format=response_format,
-        )
-
-    def biotypes_name(self, name: str, callback=None, object_type=None, response_format="json"):
-        return self.get(
-            f"info/biotypes/name/{name}/{object_type}",
-            params=dict(callback=callback, object_type=object_type),
-            response_format=response_format,
-        )
-
-    def compara_methods(self, callback=None, compara=None, response_format="json", **kwargs):
-        return self.get(
-            f"info/compara/methods",
-            params=dict(callback=callback, compara=compara, **kwargs),
-            response_format=response_format,
-        )
-
-    def compara_species_sets(self, method: str, callback=None, compara=None, response_format="json"):
-        return self.get(
-            f"info/compara/species_sets/{method}",
-            params=dict(callback=callback, compara=compara),
-            response_format=response_format,
-        )
-
-    def comparas(self, callback=None, response_format="json"):
-        return self.get(f"info/comparas", params=dict(callback=callback), response_format=response_format)
-
-    def data(self, callback=None, response_format="json"):
-        return self.get(f"info/data", params=dict(callback=callback), response_format=response_format)
-
-    def eg_version(self, callback=None, response_format="json"):
-        return self.get(f"info/eg_version", params=dict(callback=callback), response_format=response_format)
-
-    def external_dbs(self, species: str, callback=None, feature=None, filter=None, response_format="json"):
-        return self.get(
-            f"info/external_dbs/{species}",
-            params=dict(callback=callback, feature=feature, filter=filter),
-            response_format=response_format,
-        )
-
-    def info_divisions(self, callback=None, response_format="json"):
-        return self.get(f"info/divisions", params=dict(callback=callback), response_format=response_format)
-
-    def info_genome(self, name: str, callback=None, expand=None, response_format="json"):
-        return self.get(
-            f"info/genomes/{name}",
-            params=dict(callback=callback, expand=expand),
-            response_format=response_format,
-        )
-
-    def info_genomes_accession(self, accession: str, callback=None, expand=None, response_format="json"):
-        return self.get(
-            f"info/genomes/accession/{accession}",
-            params=dict(callback=callback, expand=expand),
-            response_format=response_format,
-        )
-
-    def info_genomes_assembly(self, assembly_id: str, callback=None, expand=None, response_format="json"):
-        return self.get(
-            f"info/genomes/assembly/{assembly_id}",
-            params=dict(callback=callback, expand=expand),
-            response_format=response_format,
-        )
-
-    def info_genomes_division(self, division: str, callback=None, expand=None, response_format="json"):
-        return self.get(
-            f"info/genomes/division/{division}",
-            params=dict(callback=callback, expand=expand),
-            response_format=response_format,
-        )
-
-    def info_genomes_taxonomy(self, taxon_name: str, callback=None, expand=None, response_format="json"):
-        return self.get(
-            f"info/genomes/taxonomy/{taxon_name}",
-            params=dict(callback=callback, expand=expand),
-            response_format=response_format,
-        )
-
-    def ping(self, callback=None, response_format="json"):
-        return self.get(f"info/ping", params=dict(callback=callback), response_format=response_format)
-
-    def rest(self, callback=None, response_format="json"):
-        return self.get(f"info/rest", params=dict(callback=callback), response_format=response_format)
-
-    def software(self, callback=None, response_format="json"):
-        return self.get(f"info/software", params=dict(callback=callback), response_format=response_format)
-
-    def species(self,
-                callback=None, division=None, hide_strain_info=None, strain_collection=None, response_format="json"):
-        return self.get(
-            f"info/species",
-            params=dict(
-                callback=callback,
-                division=division,
-                hide_strain_info=hide_strain_info,
-                strain_collection=strain_collection,
-            ),
-            response_format=response_format,
-        )
-
-    def variation(self, species: str, callback=None, filter=None, response_format="json"):
-        return self.get(
-            f"info/variation/{species}",
-            params=dict(callback=callback, filter=filter),
-            response_format=response_format,
-        )
-
-    def variation_consequence_types(self, callback=None, rank=None, response_format="json"):
-        return self.get(
-            f"info/variation/consequence_types",
-            params=dict(callback=callback, rank=rank),
-            response_format=response_format,
-        )
-
-    def variation_population_name(self, population_name: str, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"info/variation/populations/{species}/{population_name}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def variation_populations(self, species: str, callback=None, filter=None, response_format="json"):
-        return self.get(
-            f"info/variation/populations/{species}",
-            params=dict(callback=callback, filter=filter),
-            response_format=response_format,
-        )
-
-    def ld_id_get(self,
-                  id: str,
-                  population_name: str,
-                  species: str,
-                  attribs=None,
-                  callback=None,
-                  d_prime=None,
-                  r2=None,
-                  window_size=None,
-                  response_format="json"):
-        return self.get(
-            f"ld/{species}/{id}/{population_name}",
-            params=dict(
-                attribs=attribs,
-                callback=callback,
-                d_prime=d_prime,
-                r2=r2,
-                window_size=window_size,
-            ),
-            response_format=response_format,
-        )
-
-    def ld_pairwise_get(self,
-                        id1: str,
-                        id2: str,
-                        species: str,
-                        callback=None,
-                        d_prime=None,
-                        population_name=None,
-                        r2=None,
-                        response_format="json"):
-        return self.get(
-            f"ld/{species}/pairwise/{id1}/{id2}",
-            params=dict(
-                callback=callback, d_prime=d_prime, population_name=population_name, r2=r2
-            ),
-            response_format=response_format,
-        )
-
-    def ld_region_get(self,
-                      population_name: str,
-                      region: str,
-                      species: str,
-                      callback=None,
-                      d_prime=None,
-                      r2=None,
-                      response_format="json"):
-        return self.get(
-            f"ld/{species}/region/{region}/{population_name}",
-            params=dict(callback=callback, d_prime=d_prime, r2=r2),
-            response_format=response_format,
-        )
-
-    @singledispatchmethod
-    def lookup(self,
-               id: str,
-               callback=None,
-               db_type=None,
-               expand=None,
-               format=None,
-               mane=None,
-               phenotypes=None,
-               species=None,
-               utr=None,
-               response_format="json"):
-        return self.get(
-            f"lookup/id/{id}",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                expand=expand,
-                response_format=response_format,
-                mane=mane,
-                phenotypes=phenotypes,
-                species=species,
-                utr=utr,
-            ),
-            response_format=response_format,
-        )
-
-    @lookup.register
-    def _(self,
-          id: list,
-          callback=None,
-          db_type=None,
-          expand=None,
-          format=None,
-          object_type=None,
-          species=None,
-          response_format="json"):
-        return self.post(
-            f"lookup/id",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                expand=expand,
-                response_format=response_format,
-                object_type=object_type,
-                species=species,
-            ),
-            response_format=response_format,
-            json={"ids": id},
-        )
-
-    @singledispatchmethod
-    def symbol_lookup(self, symbol: str, species: str, callback=None, expand=None, format=None, response_format="json"):
-        return self.get(
-            f"lookup/symbol/{species}/{symbol}",
-            params=dict(callback=callback, expand=expand,
-                        response_format=response_format),
-            response_format=response_format,
-        )
-
-    @symbol_lookup.register
-    def _(self, symbol: list, species: str, callback=None, expand=None, format=None, response_format="json"):
-        return self.post(
-            f"lookup/symbol/{species}",
-            params=dict(callback=callback, expand=expand,
-                        response_format=response_format),
-            response_format=response_format,
-            json={"symbols": symbol},
-        )
-
-    def assembly_cdna(self,
-                      id: str, region: str, callback=None, include_original_region=None, species=None, response_format="json"):
-        return self.get(
-            f"map/cdna/{id}/{region}",
-            params=dict(
-                callback=callback,
-                include_original_region=include_original_region,
-                species=species,
-            ),
-            response_format=response_format,
-        )
-
-    def assembly_cds(self,
-                     id: str, region: str, callback=None, include_original_region=None, species=None, response_format="json"):
-        return self.get(
-            f"map/cds/{id}/{region}",
-            params=dict(
-                callback=callback,
-                include_original_region=include_original_region,
-                species=species,
-            ),
-            response_format=response_format,
-        )
-
-    def assembly_map(self,
-                     asm_one: str,
-                     asm_two: str,
-                     region: str,
-                     species: str,
-                     callback=None,
-                     coord_system=None,
-                     target_coord_system=None, response_format="json"):
-        return self.get(
-            f"map/{species}/{asm_one}/{region}/{asm_two}",
-            params=dict(
-                callback=callback,
-                coord_system=coord_system,
-                target_coord_system=target_coord_system,
-            ),
-            response_format=response_format,
-        )
-
-    def assembly_translation(self, id: str, region: str, callback=None, species=None, response_format="json"):
-        return self.get(
-            f"map/translation/{id}/{region}",
-            params=dict(callback=callback, species=species),
-            response_format=response_format,
-        )
-
-    def ontology_ancestors(self, id: str, callback=None, ontology=None, response_format="json"):
-        return self.get(
-            f"ontology/ancestors/{id}",
-            params=dict(callback=callback, ontology=ontology),
-            response_format=response_format,
-        )
-
-    def ontology_ancestors_chart(self, id: str, callback=None, ontology=None, response_format="json"):
-        return self.get(
-            f"ontology/ancestors/chart/{id}",
-            params=dict(callback=callback, ontology=ontology),
-            response_format=response_format,
-        )
-
-    def ontology_descendants(self,
-                             id: str,
-                             callback=None,
-                             closest_term=None,
-                             ontology=None,
-                             subset=None,
-                             zero_distance=None,
-                             response_format="json"):
-        return self.get(
-            f"ontology/descendants/{id}",
-            params=dict(
-                callback=callback,
-                closest_term=closest_term,
-                ontology=ontology,
-                subset=subset,
-                zero_distance=zero_distance,
-            ),
-            response_format=response_format,
-        )
-
-    def ontology_id(self, id: str, callback=None, relation=None, simple=None, response_format="json"):
-        return self.get(
-            f"ontology/id/{id}",
-            params=dict(callback=callback, relation=relation, simple=simple),
-            response_format=response_format,
-        )
-
-    def ontology_name(self, name: str, callback=None, ontology=None, relation=None, simple=None, response_format="json"):
-        return self.get(
-            f"ontology/name/{name}",
-            params=dict(
-                callback=callback, ontology=ontology, relation=relation, simple=simple
-            ),
-            response_format=response_format,
-        )
-
-    def taxonomy_classification(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"taxonomy/classification/{id}", params=dict(callback=callback), response_format=response_format
-        )
-
-    def taxonomy_id(self, id: str, callback=None, simple=None, response_format="json"):
-        return self.get(
-            f"taxonomy/id/{id}",
-            params=dict(callback=callback, simple=simple),
-            response_format=response_format,
-        )
-
-    def taxonomy_name(self, name: str, callback=None, response_format="json"):
-        return self.get(f"taxonomy/name/{name}", params=dict(callback=callback), response_format=response_format)
-
-    def overlap_id(self,
-                   id: str,
-                   feature: str,
-                   biotype=None,
-                   callback=None,
-                   db_type=None,
-                   logic_name=None,
-                   misc_set=None,
-                   object_type=None,
-                   so_term=None,
-                   species=None,
-                   species_set=None,
-                   variant_set=None,
-                   response_format="json"):
-        return self.get(
-            f"overlap/id/{id}",
-            params=dict(
-                feature=feature,
-                biotype=biotype,
-                callback=callback,
-                db_type=db_type,
-                logic_name=logic_name,
-                misc_set=misc_set,
-                object_type=object_type,
-                so_term=so_term,
-                species=species,
-                species_set=species_set,
-                variant_set=variant_set,
-            ),
-            response_format=response_format,
-        )
-
-    def overlap_region(self,
-                       species: str,
-                       region: str,
-                       feature: str,
-                       biotype=None,
-                       callback=None,
-                       db_type=None,
-                       logic_name=None,
-                       misc_set=None,
-                       so_term=None,
-                       species_set=None,
-                       trim_downstream=None,
-                       trim_upstream=None,
-                       variant_set=None,
-                       response_format="json"):
-        return self.get(
-            f"overlap/region/{species}/{region}",
-            params=dict(
-                feature=feature,
-                biotype=biotype,
-                callback=callback,
-                db_type=db_type,
-                logic_name=logic_name,
-                misc_set=misc_set,
-                so_term=so_term,
-                species_set=species_set,
-                trim_downstream=trim_downstream,
-                trim_upstream=trim_upstream,
-                variant_set=variant_set,
-            ),
-            response_format=response_format,
-        )
-
-    def overlap_translation(self,
-                            id: str,
-                            callback=None,
-                            db_type=None,
-                            feature=None,
-                            so_term=None,
-                            species=None,
-                            type=None,
-                            response_format="json"):
-        return self.get(
-            f"overlap/translation/{id}",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                feature=feature,
-                so_term=so_term,
-                species=species,
-                type=type,
-            ),
-            response_format=response_format,
-        )
-
-    def phenotype_accession(self,
-                            species: str,
-                            accession: str,
-                            callback=None,
-                            include_children=None,
-                            include_pubmed_id=None,
-                            include_review_status=None,
-                            source=None,
-                            response_format="json"):
-        return self.get(
-            f"/phenotype/accession/{species}/{accession}",
-            params=dict(
-                callback=callback,
-                include_children=include_children,
-                include_pubmed_id=include_pubmed_id,
-                include_review_status=include_review_status,
-                source=source,
-            ),
-            response_format=response_format,
-        )
-
-    def phenotype_gene(self,
-                       species: str,
-                       gene: str,
-                       callback=None,
-                       include_associated=None,
-                       include_overlap=None,
-                       include_pubmed_id=None,
-                       include_review_status=None,
-                       include_submitter=None,
-                       non_specified=None,
-                       trait=None,
-                       tumour=None,
-                       response_format="json"):
-        return self.get(
-            f"/phenotype/gene/{species}/{gene}",
-            params=dict(
-                callback=callback,
-                include_associated=include_associated,
-                include_overlap=include_overlap,
-                include_pubmed_id=include_pubmed_id,
-                include_review_status=include_review_status,
-                include_submitter=include_submitter,
-                non_specified=non_specified,
-                trait=trait,
-                tumour=tumour,
-            ),
-            response_format=response_format,
-        )
-
-    def phenotype_region(self,
-                         species: str,
-                         region: str,
-                         callback=None,
-                         feature_type=None,
-                         include_pubmed_id=None,
-                         include_review_status=None,
-                         include_submitter=None,
-                         non_specified=None,
-                         only_phenotypes=None,
-                         trait=None,
-                         tumour=None,
-                         response_format="json"):
-        return self.get(
-            f"/phenotype/region/{species}/{region}",
-            params=dict(
-                callback=callback,
-                feature_type=feature_type,
-                include_pubmed_id=include_pubmed_id,
-                include_review_status=include_review_status,
-                include_submitter=include_submitter,
-                non_specified=non_specified,
-                only_phenotypes=only_phenotypes,
-                trait=trait,
-                tumour=tumour,
-            ),
-            response_format=response_format,
-        )
-
-    def phenotype_term(self,
-                       species: str,
-                       term: str,
-                       callback=None,
-                       include_children=None,
-                       include_pubmed_id=None,
-                       include_review_status=None,
-                       source=None,
-                       response_format="json"):
-        return self.get(
-            f"/phenotype/term/{species}/{term}",
-            params=dict(
-                callback=callback,
-                include_children=include_children,
-                include_pubmed_id=include_pubmed_id,
-                include_review_status=include_review_status,
-                source=source,
-            ),
-            response_format=response_format,
-        )
-
-    def array(self, species: str, microarray: str, vendor: str, callback=None, response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/microarray/{microarray}/vendor/{vendor}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def fetch_all_epigenomes(self, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/epigenome",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def get_binding_matrix(self, species: str, binding_matrix: str, callback=None, unit=None, response_format="json"):
-        return self.get(
-            f"species/{species}/binding_matrix/{binding_matrix}/",
-            params=dict(callback=callback, unit=unit),
-            response_format=response_format,
-        )
-
-    def list_all_microarrays(self, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/microarray",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def probe(self,
-              species: str,
-              microarray: str,
-              probe: str,
-              callback=None,
-              gene=None,
-              transcripts=None,
-              response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/microarray/{microarray}/probe/{probe}",
-            params=dict(callback=callback, gene=gene, transcripts=transcripts),
-            response_format=response_format,
-        )
-
-    def probe_set(self,
-                  species: str,
-                  microarray: str,
-                  probe_set: str,
-                  callback=None,
-                  gene=None,
-                  transcripts=None,
-                  response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/microarray/{
-                microarray}/probe_set/{probe_set}",
-            params=dict(callback=callback, gene=gene, transcripts=transcripts),
-            response_format=response_format,
-        )
-
-    def regulatory_id(self, species: str, id: str, activity=None, callback=None, response_format="json"):
-        return self.get(
-            f"regulatory/species/{species}/id/{id}",
-            params=dict(activity=activity, callback=callback),
-            response_format=response_format,
-        )
-
-    @singledispatchmethod
-    def sequence_id(self,
-                    id: str,
-                    callback=None,
-                    db_type=None,
-                    end=None,
-                    expand_3prime=None,
-                    expand_5prime=None,
-                    format=None,
-                    mask=None,
-                    mask_feature=None,
-                    multiple_sequences=None,
-                    object_type=None,
-                    species=None,
-                    start=None,
-                    type=None,
-                    response_format="json"):
-        return self.get(
-            f"sequence/id/{id}",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                end=end,
-                expand_3prime=expand_3prime,
-                expand_5prime=expand_5prime,
-                response_format=response_format,
-                mask=mask,
-                mask_feature=mask_feature,
-                multiple_sequences=multiple_sequences,
-                object_type=object_type,
-                species=species,
-                start=start,
-                type=type,
-            ),
-            response_format=response_format,
-        )
-
-    @sequence_id.register
-    def _(self,
-          id: list,
-          callback=None,
-          db_type=None,
-          end=None,
-          expand_3prime=None,
-          expand_5prime=None,
-          format=None,
-          mask=None,
-          mask_feature=None,
-          object_type=None,
-          species=None,
-          start=None,
-          type=None,
-          response_format="json"):
-        return self.post(
-            f"sequence/id",
-            params=dict(
-                callback=callback,
-                db_type=db_type,
-                end=end,
-                expand_3prime=expand_3prime,
-                expand_5prime=expand_5prime,
-                response_format=response_format,
-                mask=mask,
-                mask_feature=mask_feature,
-                object_type=object_type,
-                species=species,
-                start=start,
-                type=type,
-            ),
-            response_format=response_format,
-            json={"ids": id},
-        )
-
-    @singledispatchmethod
-    def sequence_region(self,
-                        region: str,
-                        species: str,
-                        callback=None,
-                        coord_system=None,
-                        coord_system_version=None,
-                        expand_3prime=None,
-                        expand_5prime=None,
-                        format=None,
-                        mask=None,
-                        mask_feature=None,
-                        response_format="json"):
-        return self.get(
-            f"sequence/region/{species}/{region}",
-            params=dict(
-                callback=callback,
-                coord_system=coord_system,
-                coord_system_version=coord_system_version,
-                expand_3prime=expand_3prime,
-                expand_5prime=expand_5prime,
-                response_format=response_format,
-                mask=mask,
-                mask_feature=mask_feature,
-            ),
-            response_format=response_format,
-        )
-
-    @sequence_region.register
-    def _(self,
-          region: list,
-          species: str,
-          callback=None,
-          coord_system=None,
-          coord_system_version=None,
-          expand_3prime=None,
-          expand_5prime=None,
-          format=None,
-          mask=None,
-          mask_feature=None,
-          response_format="json"):
-        return self.post(
-            f"sequence/region/{species}",
-            params=dict(
-                callback=callback,
-                coord_system=coord_system,
-                coord_system_version=coord_system_version,
-                expand_3prime=expand_3prime,
-                expand_5prime=expand_5prime,
-                format=format,
-                mask=mask,
-                mask_feature=mask_feature,
-            ),
-            response_format=response_format,
-            json={"regions": region},
-        )
-
-    def transcript_haplotypes_get(self,
-                                  id: str,
-                                  species: str,
-                                  aligned_sequences=None,
-                                  callback=None,
-                                  samples=None,
-                                  sequence=None,
-                                  response_format="json"):
-        return self.get(
-            f"transcript_haplotypes/{species}/{id}",
-            params=dict(
-                aligned_sequences=aligned_sequences,
-                callback=callback,
-                samples=samples,
-                sequence=sequence,
-            ),
-            response_format=response_format,
-        )
-
-    @singledispatchmethod
-    def vep_hgvs(self,
-                 hgvs_notation: str,
-                 species: str,
-                 AncestralAllele=None,
-                 Blosum62=None,
-                 CADD=None,
-                 Conservation=None,
-                 DisGeNET=None,
-                 EVE=None,
-                 GO=None,
-                 GeneSplicer=None,
-                 Geno2MP=None,
-                 IntAct=None,
-                 LoF=None,
-                 Mastermind=None,
-                 MaveDB=None,
-                 MaxEntScan=None,
-                 NMD=None,
-                 Phenotypes=None,
-                 SpliceAI=None,
-                 UTRAnnotator=None,
-                 ambiguous_hgvs=None,
-                 appris=None,
-                 callback=None,
-                 canonical=None,
-                 ccds=None,
-                 dbNSFP=None,
-                 dbscSNV=None,
-                 distance=None,
-                 domains=None,
-                 failed=None,
-                 flag_pick=None,
-                 flag_pick_allele=None,
-                 flag_pick_allele_gene=None,
-                 ga4gh_vrs=None,
-                 gencode_basic=None,
-                 hgvs=None,
-                 mane=None,
-                 merged=None,
-                 minimal=None,
-                 mirna=None,
-                 mutfunc=None,
-                 numbers=None,
-                 per_gene=None,
-                 pick=None,
-                 pick_allele=None,
-                 pick_allele_gene=None,
-                 pick_order=None,
-                 protein=None,
-                 refseq=None,
-                 shift_3prime=None,
-                 shift_genomic=None,
-                 transcript_id=None,
-                 transcript_version=None,
-                 tsl=None,
-                 uniprot=None,
-                 variant_class=None,
-                 vcf_string=None,
-                 xref_refseq=None,
-                 response_format="json"):
-        return self.get(
-            f"vep/{species}/hgvs/{hgvs_notation}",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                Conservation=Conservation,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                ambiguous_hgvs=ambiguous_hgvs,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-        )
-
-    @vep_hgvs.register
-    def _(self,
-          hgvs_notation: list,
-          species: str,
-          AncestralAllele=None,
-          Blosum62=None,
-          CADD=None,
-          DisGeNET=None,
-          EVE=None,
-          GO=None,
-          GeneSplicer=None,
-          Geno2MP=None,
-          IntAct=None,
-          LoF=None,
-          Mastermind=None,
-          MaveDB=None,
-          MaxEntScan=None,
-          NMD=None,
-          Phenotypes=None,
-          SpliceAI=None,
-          UTRAnnotator=None,
-          ambiguous_hgvs=None,
-          appris=None,
-          callback=None,
-          canonical=None,
-          ccds=None,
-          dbNSFP=None,
-          dbscSNV=None,
-          distance=None,
-          domains=None,
-          failed=None,
-          flag_pick=None,
-          flag_pick_allele=None,
-          flag_pick_allele_gene=None,
-          ga4gh_vrs=None,
-          gencode_basic=None,
-          hgvs=None,
-          mane=None,
-          merged=None,
-          minimal=None,
-          mirna=None,
-          mutfunc=None,
-          numbers=None,
-          per_gene=None,
-          pick=None,
-          pick_allele=None,
-          pick_allele_gene=None,
-          pick_order=None,
-          protein=None,
-          refseq=None,
-          shift_3prime=None,
-          shift_genomic=None,
-          transcript_id=None,
-          transcript_version=None,
-          tsl=None,
-          uniprot=None,
-          variant_class=None,
-          vcf_string=None,
-          xref_refseq=None,
-          response_format="json"):
-        return self.post(
-            f"vep/{species}/hgvs",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                ambiguous_hgvs=ambiguous_hgvs,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-            json={"hgvs_notations": hgvs_notation},
-        )
-
-    @singledispatchmethod
-    def vep_id(self,
-               id: str,
-               species: str,
-               AncestralAllele=None,
-               Blosum62=None,
-               CADD=None,
-               Conservation=None,
-               DisGeNET=None,
-               EVE=None,
-               GO=None,
-               GeneSplicer=None,
-               Geno2MP=None,
-               IntAct=None,
-               LoF=None,
-               Mastermind=None,
-               MaveDB=None,
-               MaxEntScan=None,
-               NMD=None,
-               Phenotypes=None,
-               SpliceAI=None,
-               UTRAnnotator=None,
-               appris=None,
-               callback=None,
-               canonical=None,
-               ccds=None,
-               dbNSFP=None,
-               dbscSNV=None,
-               distance=None,
-               domains=None,
-               failed=None,
-               flag_pick=None,
-               flag_pick_allele=None,
-               flag_pick_allele_gene=None,
-               ga4gh_vrs=None,
-               gencode_basic=None,
-               hgvs=None,
-               mane=None,
-               merged=None,
-               minimal=None,
-               mirna=None,
-               mutfunc=None,
-               numbers=None,
-               per_gene=None,
-               pick=None,
-               pick_allele=None,
-               pick_allele_gene=None,
-               pick_order=None,
-               protein=None,
-               refseq=None,
-               shift_3prime=None,
-               shift_genomic=None,
-               transcript_id=None,
-               transcript_version=None,
-               tsl=None,
-               uniprot=None,
-               variant_class=None,
-               vcf_string=None,
-               xref_refseq=None,
-               response_format="json"):
-        return self.get(
-            f"vep/{species}/id/{id}",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                Conservation=Conservation,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-        )
-
-    @vep_id.register
-    def _(self,
-          id: list,
-          species: str,
-          AncestralAllele=None,
-          Blosum62=None,
-          CADD=None,
-          DisGeNET=None,
-          EVE=None,
-          GO=None,
-          GeneSplicer=None,
-          Geno2MP=None,
-          IntAct=None,
-          LoF=None,
-          Mastermind=None,
-          MaveDB=None,
-          MaxEntScan=None,
-          NMD=None,
-          Phenotypes=None,
-          SpliceAI=None,
-          UTRAnnotator=None,
-          appris=None,
-          callback=None,
-          canonical=None,
-          ccds=None,
-          dbNSFP=None,
-          dbscSNV=None,
-          distance=None,
-          domains=None,
-          failed=None,
-          flag_pick=None,
-          flag_pick_allele=None,
-          flag_pick_allele_gene=None,
-          ga4gh_vrs=None,
-          gencode_basic=None,
-          hgvs=None,
-          mane=None,
-          merged=None,
-          minimal=None,
-          mirna=None,
-          mutfunc=None,
-          numbers=None,
-          per_gene=None,
-          pick=None,
-          pick_allele=None,
-          pick_allele_gene=None,
-          pick_order=None,
-          protein=None,
-          refseq=None,
-          shift_3prime=None,
-          shift_genomic=None,
-          transcript_id=None,
-          transcript_version=None,
-          tsl=None,
-          uniprot=None,
-          variant_class=None,
-          vcf_string=None,
-          xref_refseq=None,
-          response_format="json"):
-        return self.post(
-            f"vep/{species}/id",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-            json={"ids": id},
-        )
-
-    @singledispatchmethod
-    def vep_region(self,
-                   region: str,
-                   allele: str,
-                   species: str,
-                   AncestralAllele=None,
-                   Blosum62=None,
-                   CADD=None,
-                   Conservation=None,
-                   DisGeNET=None,
-                   EVE=None,
-                   GO=None,
-                   GeneSplicer=None,
-                   Geno2MP=None,
-                   IntAct=None,
-                   LoF=None,
-                   Mastermind=None,
-                   MaveDB=None,
-                   MaxEntScan=None,
-                   NMD=None,
-                   Phenotypes=None,
-                   SpliceAI=None,
-                   UTRAnnotator=None,
-                   appris=None,
-                   callback=None,
-                   canonical=None,
-                   ccds=None,
-                   dbNSFP=None,
-                   dbscSNV=None,
-                   distance=None,
-                   domains=None,
-                   failed=None,
-                   flag_pick=None,
-                   flag_pick_allele=None,
-                   flag_pick_allele_gene=None,
-                   ga4gh_vrs=None,
-                   gencode_basic=None,
-                   hgvs=None,
-                   mane=None,
-                   merged=None,
-                   minimal=None,
-                   mirna=None,
-                   mutfunc=None,
-                   numbers=None,
-                   per_gene=None,
-                   pick=None,
-                   pick_allele=None,
-                   pick_allele_gene=None,
-                   pick_order=None,
-                   protein=None,
-                   refseq=None,
-                   shift_3prime=None,
-                   shift_genomic=None,
-                   transcript_id=None,
-                   transcript_version=None,
-                   tsl=None,
-                   uniprot=None,
-                   variant_class=None,
-                   vcf_string=None,
-                   xref_refseq=None,
-                   response_format="json"):
-        return self.get(
-            f"vep/{species}/region/{region}/{allele}/",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                Conservation=Conservation,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-        )
-
-    @vep_region.register
-    def _(self,
-          region: list,
-          species: str,
-          AncestralAllele=None,
-          Blosum62=None,
-          CADD=None,
-          DisGeNET=None,
-          EVE=None,
-          GO=None,
-          GeneSplicer=None,
-          Geno2MP=None,
-          IntAct=None,
-          LoF=None,
-          Mastermind=None,
-          MaveDB=None,
-          MaxEntScan=None,
-          NMD=None,
-          Phenotypes=None,
-          SpliceAI=None,
-          UTRAnnotator=None,
-          appris=None,
-          callback=None,
-          canonical=None,
-          ccds=None,
-          dbNSFP=None,
-          dbscSNV=None,
-          distance=None,
-          domains=None,
-          failed=None,
-          flag_pick=None,
-          flag_pick_allele=None,
-          flag_pick_allele_gene=None,
-          ga4gh_vrs=None,
-          gencode_basic=None,
-          hgvs=None,
-          mane=None,
-          merged=None,
-          minimal=None,
-          mirna=None,
-          mutfunc=None,
-          numbers=None,
-          per_gene=None,
-          pick=None,
-          pick_allele=None,
-          pick_allele_gene=None,
-          pick_order=None,
-          protein=None,
-          refseq=None,
-          shift_3prime=None,
-          shift_genomic=None,
-          transcript_id=None,
-          transcript_version=None,
-          tsl=None,
-          uniprot=None,
-          variant_class=None,
-          vcf_string=None,
-          xref_refseq=None,
-          response_format="json"):
-        return self.post(
-            f"vep/{species}/region",
-            params=dict(
-                AncestralAllele=AncestralAllele,
-                Blosum62=Blosum62,
-                CADD=CADD,
-                DisGeNET=DisGeNET,
-                EVE=EVE,
-                GO=GO,
-                GeneSplicer=GeneSplicer,
-                Geno2MP=Geno2MP,
-                IntAct=IntAct,
-                LoF=LoF,
-                Mastermind=Mastermind,
-                MaveDB=MaveDB,
-                MaxEntScan=MaxEntScan,
-                NMD=NMD,
-                Phenotypes=Phenotypes,
-                SpliceAI=SpliceAI,
-                UTRAnnotator=UTRAnnotator,
-                appris=appris,
-                callback=callback,
-                canonical=canonical,
-                ccds=ccds,
-                dbNSFP=dbNSFP,
-                dbscSNV=dbscSNV,
-                distance=distance,
-                domains=domains,
-                failed=failed,
-                flag_pick=flag_pick,
-                flag_pick_allele=flag_pick_allele,
-                flag_pick_allele_gene=flag_pick_allele_gene,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                hgvs=hgvs,
-                mane=mane,
-                merged=merged,
-                minimal=minimal,
-                mirna=mirna,
-                mutfunc=mutfunc,
-                numbers=numbers,
-                per_gene=per_gene,
-                pick=pick,
-                pick_allele=pick_allele,
-                pick_allele_gene=pick_allele_gene,
-                pick_order=pick_order,
-                protein=protein,
-                refseq=refseq,
-                shift_3prime=shift_3prime,
-                shift_genomic=shift_genomic,
-                transcript_id=transcript_id,
-                transcript_version=transcript_version,
-                tsl=tsl,
-                uniprot=uniprot,
-                variant_class=variant_class,
-                vcf_string=vcf_string,
-                xref_refseq=xref_refseq,
-            ),
-            response_format=response_format,
-            json={"variants": region},
-        )
-
-    @singledispatchmethod
-    def variant_recoder(self,
-                        id: str,
-                        species: str,
-                        callback=None,
-                        failed=None,
-                        fields=None,
-                        ga4gh_vrs=None,
-                        gencode_basic=None,
-                        minimal=None,
-                        var_synonyms=None,
-                        vcf_string=None,
-                        response_format="json"):
-        return self.get(
-            f"variant_recoder/{species}/{id}",
-            params=dict(
-                callback=callback,
-                failed=failed,
-                fields=fields,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                minimal=minimal,
-                var_synonyms=var_synonyms,
-                vcf_string=vcf_string,
-            ),
-            response_format=response_format,
-        )
-
-    @variant_recoder.register
-    def _(self,
-          id: list,
-          species: str,
-          callback=None,
-          failed=None,
-          fields=None,
-          ga4gh_vrs=None,
-          gencode_basic=None,
-          minimal=None,
-          var_synonyms=None,
-          vcf_string=None,
-          response_format="json"):
-        return self.post(
-            f"variant_recoder/{species}",
-            params=dict(
-                callback=callback,
-                failed=failed,
-                fields=fields,
-                ga4gh_vrs=ga4gh_vrs,
-                gencode_basic=gencode_basic,
-                minimal=minimal,
-                var_synonyms=var_synonyms,
-                vcf_string=vcf_string,
-            ),
-            response_format=response_format,
-            json={"ids": id},
-        )
-
-    @singledispatchmethod
-    def variation_id(self,
-                     id: str,
-                     species: str,
-                     callback=None,
-                     genotypes=None,
-                     genotyping_chips=None,
-                     phenotypes=None,
-                     pops=None,
-                     population_genotypes=None,
-                     response_format="json"):
-        return self.get(
-            f"variation/{species}/{id}",
-            params=dict(
-                callback=callback,
-                genotypes=genotypes,
-                genotyping_chips=genotyping_chips,
-                phenotypes=phenotypes,
-                pops=pops,
-                population_genotypes=population_genotypes,
-            ),
-            response_format=response_format,
-        )
-
-    @variation_id.register
-    def _(self,
-          id: list,
-          species: str,
-          callback=None,
-          genotypes=None,
-          phenotypes=None,
-          pops=None,
-          population_genotypes=None,
-          response_format="json"):
-        return self.post(
-            f"variation/{species}/",
-            params=dict(
-                callback=callback,
-                genotypes=genotypes,
-                phenotypes=phenotypes,
-                pops=pops,
-                population_genotypes=population_genotypes,
-            ),
-            response_format=response_format,
-            json={"ids": id},
-        )
-
-    def variation_pmcid_get(self, pmcid: str, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"variation/{species}/pmcid/{pmcid}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def variation_pmid_get(self, pmid: str, species: str, callback=None, response_format="json"):
-        return self.get(
-            f"variation/{species}/pmid/{pmid}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def beacon_get(self, callback=None, response_format="json"):
-        return self.get(f"ga4gh/beacon", params=dict(callback=callback), response_format=response_format)
-
-    def beacon_query_get(self, response_format="json", **kwargs,):
-        return self.get(f"ga4gh/beacon/query", params=dict(**kwargs), response_format=response_format)
-
-    def beacon_query_post(self, response_format="json", **kwargs):
-        return self.post(f"ga4gh/beacon/query", params={}, response_format=response_format, json=dict(**kwargs))
-
-    def features_id(self, id: str, callback=None, response_format="json"):
-        return self.get(f"ga4gh/features/{id}", params=dict(callback=callback), response_format=response_format)
-
-    def features_post(self, response_format="json", **kwargs):
-        return self.post(f"ga4gh/features/search", params={}, response_format=response_format, json=dict(**kwargs))
-
-    def gacallSet(self, response_format="json", **kwargs):
-        return self.post(f"ga4gh/callsets/search",
-                         params={}, response_format=response_format, json=dict(**kwargs))
-
-    def gacallset_id(self, id: str, callback=None, response_format="json"):
-        return self.get(f"ga4gh/callsets/{id}", params=dict(callback=callback), response_format=response_format)
-
-    def gadataset(self, callback=None, pageSize=None, pageToken=None, response_format="json"):
-        return self.post(
-            f"ga4gh/datasets/search",
-            params=dict(callback=callback), json=dict(pageSize=pageSize, pageToken=pageToken),
-            response_format=response_format,
-        )
-
-    def gadataset_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/datasets/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def gafeatureset(self,
-                     datasetId: str, callback=None, pageSize=None, pageToken=None, response_format="json"
-                     ):
-        return self.post(
-            f"ga4gh/featuresets/search",
-            params=dict(callback=callback), json=dict(datasetId=datasetId, pageSize=pageSize, pageToken=pageToken),
-            response_format=response_format,
-        )
-
-    def gafeatureset_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/featuresets/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def gavariant_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/variants/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def gavariantannotations(self,
-                             variantAnnotationSetId: str,
-                             callback=None,
-                             effects=None,
-                             end=None,
-                             pageSize=None,
-                             pageToken=None,
-                             referenceId=None,
-                             referenceName=None,
-                             start=None,
-                             response_format="json",
-                             ):
-        return self.post(
-            f"ga4gh/variantannotations/search",
-            params=dict(
-                callback=callback),
-            json=dict(variantAnnotationSetId=variantAnnotationSetId,
-                      effects=effects,
-                      end=end,
-                      pageSize=pageSize,
-                      pageToken=pageToken,
-                      referenceId=referenceId,
-                      referenceName=referenceName,
-                      start=start,
-                      ),
-            response_format=response_format,
-        )
-
-    def gavariants(self,
-                   end: str,
-                   referenceName: str,
-                   start: str,
-                   variantSetId: str,
-                   callSetIds=None,
-                   callback=None,
-                   pageSize=None,
-                   pageToken=None,
-                   response_format="json",
-                   ):
-        return self.post(
-            f"ga4gh/variants/search",
-            params=dict(callback=callback),
-            json=dict(
-                pageSize=pageSize,
-                pageToken=pageToken,
-                callSetIds=callSetIds,
-                end=end,
-                referenceName=referenceName,
-                start=start,
-                variantSetId=variantSetId,
-            ),
-            response_format=response_format,
-        )
-
-    def gavariantset(self,
-                     datasetId: str, callback=None, pageSize=None, pageToken=None, response_format="json"
-                     ):
-        return self.post(
-            f"ga4gh/variantsets/search",
-            params=dict(callback=callback), json=dict(datasetId=datasetId, pageSize=pageSize, pageToken=pageToken),
-            response_format=response_format,
-        )
-
-    def gavariantset_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/variantsets/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def references(self,
-                   referenceSetId: str,
-                   accession=None,
-                   callback=None,
-                   md5checksum=None,
-                   pageSize=None,
-                   pageToken=None,
-                   response_format="json",
-                   ):
-        return self.post(
-            f"ga4gh/references/search",
-            params=dict(callback=callback),
-            json=dict(accession=accession,
-                      referenceSetId=referenceSetId,
-                      md5checksum=md5checksum,
-                      pageSize=pageSize,
-                      pageToken=pageToken,
-                      ),
-            response_format=response_format,
-        )
-
-    def references_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/references/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def referenceSets(self,
-                      accession=None, callback=None, pageSize=None, pageToken=None, response_format="json"
-                      ):
-        return self.post(
-            f"ga4gh/referencesets/search",
-            params=dict(
-
-                callback=callback),
-            json=dict(accession=accession,
-                      pageSize=pageSize,
-                      pageToken=pageToken,
-                      ),
-            response_format=response_format,
-        )
-
-    def referenceSets_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/referencesets/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
-
-    def VariantAnnotationSet(self,
-                             variantSetId: str,
-                             callback=None,
-                             pageSize=None,
-                             pageToken=None,
-                             response_format="json",
-                             ):
-        return self.post(
-            f"ga4gh/variantannotationsets/search",
-            params=dict(callback=callback), json=dict(variantSetId=variantSetId, pageSize=pageSize, pageToken=pageToken),
-            response_format=response_format,
-        )
-
-    def VariantAnnotationSet_id(self, id: str, callback=None, response_format="json"):
-        return self.get(
-            f"ga4gh/variantannotationsets/{id}",
-            params=dict(callback=callback),
-            response_format=response_format,
-        )
+        self.session = None
+        self.transport = transport
+        self.timeout = timeout
+        self.vep_batch_size = vep_batch_size
+        self._memoized = {}
+        if cache:
+            for name in _MEMOIZED:
+                self._memoized[name] = _memoize(getattr(Ensembl, name).__wrapped__.__get__(self), None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.clear_cache()
+
+    def clear_cache(self):
+        for fn in self._memoized.values():
+            fn.cache_clear()
+
+    def bind(self, method, **fixed):
+        fn = getattr(self, method)
+        signature(fn).bind_partial(**fixed)
+        if method in _OPTIONS and "options" not in fixed:
+            options = globals()[_OPTIONS[method]]
+            keys = fixed.keys() & set(options.__match_args__)
+            if keys:
+                fixed["options"] = options(**{k: fixed.pop(k) for k in keys})
+        return partial(fn, **fixed)
+
+    def get(self, endpoint, params, response_format, stream=False):
+        if stream:
+            response = _request("GET", endpoint, _HEADERS_GET[response_format], params, stream=True,
+                                base=self.server, session=self.session or get_session(self.transport),
+                                timeout=self.timeout)
+            return _iter_body(response, response_format)
+        key = _request_key(endpoint, params, response_format)
+        if key is None:
+            return self._get(endpoint, params, response_format)
+        return _coalesce((self.server, key), self._get, endpoint, params, response_format)
+
+    def _get(self, endpoint, params, response_format):
+        response = _request("GET", endpoint, _HEADERS_GET[response_format], params,
+                            base=self.server, session=self.session or get_session(self.transport),
+                            timeout=self.timeout)
+        return _decode(response, response_format)
+
+    def post(self, endpoint, params, json, response_format, stream=False):
+        response = _request("POST", endpoint, _HEADERS_POST[response_format], params, json, stream,
+                            base=self.server, session=self.session or get_session(self.transport),
+                            timeout=self.timeout)
+        if stream:
+            return _iter_body(response, response_format)
+        return _decode(response, response_format)
+
+
+for _spec in _ENDPOINTS:
+    _fn = _make_wrapper(*_spec, stream=_spec[0] in _STREAMING, bound=True)
+    _fn.__qualname__ = f"Ensembl.{_fn.__name__}"
+    setattr(Ensembl, _fn.__name__, _fn)
+for _spec in _DISPATCH_ENDPOINTS:
+    _fn = _make_dispatch_wrapper(*_spec, stream=_spec[0] in _STREAMING, options=_OPTIONS.get(_spec[0]),
+                                 bound=True)
+    _fn.__qualname__ = f"Ensembl.{_fn.__name__}"
+    setattr(Ensembl, _fn.__name__, _fn)
+def _memoized_method(fn):
+    name = fn.__name__
+
+    @wraps(fn)
+    def method(self, *args, **kwargs):
+        memoized = self._memoized.get(name)
+        if memoized is None:
+            return fn(self, *args, **kwargs)
+        return memoized(*args, **kwargs)
+
+    return method
+
+
+for _name in _POST_CAPS:
+    setattr(Ensembl, _name, _chunked_post(getattr(Ensembl, _name), bound=True))
+for _name in _FAN_OUT:
+    setattr(Ensembl, _name, _fan_out(getattr(Ensembl, _name), bound=True))
+for _name in _MEMOIZED:
+    setattr(Ensembl, _name, _memoized_method(getattr(Ensembl, _name)))
+Ensembl.archive = Ensembl.archive_id
+del _spec, _fn, _name
+
+
+class AsyncEnsembl(Ensembl):
+    __slots__ = ("max_inflight", "semaphore", "retries")
+
+    def __init__(self, max_inflight=64, retries=5, transport="aiohttp", timeout=None):
+        self.server = "https://rest.ensembl.org/"
+        self.session = None
+        self.timeout = timeout
+        self.max_inflight = max_inflight
+        self.semaphore = asyncio.Semaphore(max_inflight)
+        self.retries = retries
+        self.transport = transport
+        self.vep_batch_size = vep_batch_size
+        self._memoized = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await (self.session.aclose() if self.transport == "httpx" else self.session.close())
+            self.session = None
+
+    def _open(self, method, endpoint, headers, params, data):
+        if self.session is None and self.transport == "httpx":
+            import httpx
+
+            self.session = httpx.AsyncClient(
+                base_url=self.server, headers=_SESSION_HEADERS, http2=True,
+                limits=httpx.Limits(max_connections=self.max_inflight, keepalive_expiry=75),
+                timeout=_atimeout("httpx", _timeout_for("GET", self.timeout)))
+        elif self.session is None:
+            import aiohttp
+
+            self.session = aiohttp.ClientSession(
+                base_url=self.server, headers=_SESSION_HEADERS,
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_inflight, ttl_dns_cache=300,
+                                               keepalive_timeout=75),
+                timeout=_atimeout("aiohttp", _timeout_for("GET", self.timeout)))
+        timeout = _atimeout(self.transport, _timeout_for(method, self.timeout))
+        if self.transport == "httpx":
+            return self.session.stream(method, endpoint, headers=headers, params=params, content=data,
+                                       timeout=timeout)
+        return self.session.request(method, endpoint, headers=headers, params=params, data=data, timeout=timeout)
+
+    async def request(self, method, endpoint, params, json, headers, response_format):
+        data = None if json is None else _dumps(json)
+        httpx = self.transport == "httpx"
+        async with self.semaphore:
+            async with _aresponse(lambda: self._open(method, endpoint, headers, params, data),
+                                  self.retries) as response:
+                body = await (response.aread() if httpx else response.read())
+                if response_format == "json":
+                    return await _aloads(body)
+                elif response_format in _RAW_FORMATS:
+                    return body
+                else:
+                    return response.text if httpx else await response.text()
+
+    async def stream(self, method, endpoint, params, json, headers, response_format):
+        data = None if json is None else _dumps(json)
+        async with self.semaphore:
+            async with _aresponse(lambda: self._open(method, endpoint, headers, params, data),
+                                  self.retries) as response:
+                async for record in _aiter_body(response, response_format):
+                    yield record
+
+    def get(self, endpoint, params, response_format, stream=False):
+        if stream:
+            return self.stream("GET", endpoint, params, None, _HEADERS_GET[response_format], response_format)
+        args = ("GET", endpoint, params, None, _HEADERS_GET[response_format], response_format)
+        key = _request_key(endpoint, params, response_format)
+        if key is None:
+            return self.request(*args)
+        return _acoalesce((self.server, key), self.request, *args)
+
+    def post(self, endpoint, params, json, response_format, stream=False):
+        if stream:
+            return self.stream("POST", endpoint, params, json, _HEADERS_POST[response_format], response_format)
+        return self.request("POST", endpoint, params, json, _HEADERS_POST[response_format], response_format)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import pathlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import module_from_spec, spec_from_file_location
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+_spec = spec_from_file_location("ensembl", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)])
+ensembl = sys.modules["ensembl"] = module_from_spec(_spec)
+_spec.loader.exec_module(ensembl)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        record = dict(method=self.command, path=url.path, query=dict(parse_qsl(url.query)),
+                      body=json.loads(body) if body else None, headers=dict(self.headers))
+        self.server.log.append(record)
+        result = self.server.respond(record)
+        if isinstance(result, int):
+            self.send_response(result)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        for name, value in self.server.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture
+def server(monkeypatch):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.log = []
+    httpd.respond = lambda record: record
+    httpd.headers = {}
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/"
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(ensembl, "_BASE", httpd.url)
+    monkeypatch.setattr(ensembl, "session", requests.Session())
+    ensembl.clear_cache()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    client = ensembl.Ensembl()
+    client.server = server.url
+    return client
+
+
+def test_class_fans_out_id_lists(server, client):
+    result = client.gavariant_id(["g1", "g2"])
+    assert sorted(result) == ["g1", "g2"]
+    assert result["g1"]["path"] == "/ga4gh/variants/g1"
+    assert sorted(record["path"] for record in server.log) == ["/ga4gh/variants/g1", "/ga4gh/variants/g2"]
+
+
+@pytest.mark.parametrize("call", [
+    lambda client: ensembl.beacon_query_post(referenceName="7", start=140453136, alternateBases=None),
+    lambda client: client.beacon_query_post(referenceName="7", start=140453136, alternateBases=None),
+])
+def test_kwargs_post_body_skips_unset_fields(server, client, call):
+    call(client)
+    assert server.log[-1]["body"] == {"referenceName": "7", "start": 140453136}
+
+
+def test_client_close_keeps_shared_pools(server, client):
+    shared = ensembl.session
+    with client:
+        client.ping()
+    assert ensembl.session is shared
+    assert ensembl.ping()["path"] == "/info/ping"
+
+
+def test_async_stream_yields_records(server):
+    server.respond = lambda record: [{"input": i} for i in record["body"]["ids"]]
+
+    async def collect():
+        async with ensembl.AsyncEnsembl() as client:
+            client.server = server.url
+            streamed = [r async for r in client.vep_id(["rs1", "rs2", "rs3"], "human", stream=True)]
+        chunked = await ensembl.vep_id_async([f"rs{i}" for i in range(450)], "human", stream=True)
+        chunked = [r async for r in chunked]
+        await ensembl.close_async_session()
+        return streamed, chunked
+
+    streamed, chunked = asyncio.run(collect())
+    assert streamed == [{"input": "rs1"}, {"input": "rs2"}, {"input": "rs3"}]
+    assert [r["input"] for r in chunked] == [f"rs{i}" for i in range(450)]
+
+
+def test_async_module_path_retries_429(server):
+    server.respond = lambda record: 429 if len(server.log) % 2 else record
+
+    async def fetch():
+        try:
+            return await ensembl.xref_id_async("G"), await ensembl.lookup_async(["A", "B"])
+        finally:
+            await ensembl.close_async_session()
+
+    got, posted = asyncio.run(fetch())
+    assert got["path"] == "/xrefs/id/G"
+    assert posted["method"] == "POST"
+    assert len(server.log) == 4
+
+
+def test_backoff_follows_adapter_retry_policy():
+    assert ensembl._backoff({"Retry-After": "0.5"}, 3) == 0.5
+    assert ensembl._backoff({}, 0) == 0
+    assert 2 <= ensembl._backoff({}, 1) <= 2.5
+    assert ensembl._backoff({}, 10) == ensembl._RETRY.backoff_max == 32
+
+
+def test_single_item_list_keeps_post_shape_for_raw_formats(server):
+    one = json.loads(ensembl.variation_id(["rs1"], "human", response_format="bytes"))
+    two = json.loads(ensembl.variation_id(["rs1", "rs2"], "human", response_format="bytes"))
+    assert (one["method"], one["body"]) == ("POST", {"ids": ["rs1"]})
+    assert (two["method"], two["body"]) == ("POST", {"ids": ["rs1", "rs2"]})
+    assert ensembl.variation_id(["rs1"], "human")["rs1"]["method"] == "GET"
+
+
+def test_client_timeout_overrides_defaults(server):
+    server.respond = lambda record: time.sleep(0.3) or record
+    assert ensembl._timeout_for("POST")[1] > ensembl._timeout_for("GET")[1]
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client = ensembl.Ensembl(timeout=(1.0, 0.05))
+        client.server = server.url
+        client.xref_id("G")
+    client = ensembl.Ensembl()
+    client.server = server.url
+    assert client.xref_id("G")["path"] == "/xrefs/id/G"
+
+
+def test_memoized_results_are_not_shared(server):
+    first = ensembl.assembly_info("human")
+    first["path"] = "mutated"
+    assert ensembl.assembly_info("human")["path"] == "/info/assembly/human"
+    assert len(server.log) == 1
+
+
+@pytest.mark.parametrize("call, path", [
+    (lambda client: ensembl.xref_id(id="X"), "/xrefs/id/X"),
+    (lambda client: client.xref_id(id="X"), "/xrefs/id/X"),
+    (lambda client: client.gacallset_id(id="3:NA"), "/ga4gh/callsets/3:NA"),
+    (lambda client: client.gacallset_id(id=["3:NA"])["3:NA"], "/ga4gh/callsets/3:NA"),
+])
+def test_id_endpoints_accept_keyword_id(server, client, call, path):
+    assert call(client)["path"] == path
+    with pytest.raises(TypeError):
+        client.xref_id()
+
+
+@pytest.mark.parametrize("call", [
+    lambda client: ensembl.lookup(id=["A", "B"]),
+    lambda client: client.lookup(id=["A", "B"]),
+    lambda client: client.archive_id(id=["A", "B"]),
+    lambda client: client.vep_hgvs(hgvs_notation=["A", "B"], species="human"),
+])
+def test_post_endpoints_accept_keyword_items(server, client, call):
+    call(client)
+    assert server.log[-1]["method"] == "POST"
+    assert list(server.log[-1]["body"].values()) == [["A", "B"]]
+
+
+@pytest.mark.skipif(ensembl.requests_cache is None, reason="requests_cache not installed")
+def test_disk_cache_is_named_per_release(server, monkeypatch, tmp_path):
+    server.respond = lambda record: {"releases": [112, 113]} if record["path"] == "/info/data" else record
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(ensembl, "session", None)
+    try:
+        session = ensembl.get_session()
+        assert session.cache.db_path == tmp_path / "ensembl-113.sqlite"
+        assert session.settings.urls_expire_after["*/taxonomy/*"] == 7 * 86400
+    finally:
+        ensembl.close_session()
+
+
+def test_vep_region_requires_path_arguments(server, client):
+    for call in (lambda: ensembl.vep_region("9:1-2"), lambda: client.vep_region("9:1-2", "C"),
+                 lambda: ensembl.vep_region(["9 1 . A C"])):
+        with pytest.raises(TypeError):
+            call()
+    assert server.log == []
+    assert ensembl.vep_region("9:1-2", "C", "human")["path"] == "/vep/human/region/9:1-2/C/"
+    assert ensembl.vep_region(["9 1 . A C"], "human")["path"] == "/vep/human/region"
+
+
+def test_cached_client_memoizes_without_instance_dict(server):
+    client = ensembl.Ensembl(cache=True)
+    client.server = server.url
+    assert not hasattr(client, "__dict__")
+    assert client.assembly_info("human") == client.assembly_info("human")
+    assert len(server.log) == 1
+    client.clear_cache()
+    client.assembly_info("human")
+    assert len(server.log) == 2
+
+
+def test_bytes_format_is_not_a_public_media_type(server):
+    assert "bytes" not in ensembl.media_type
+    body = ensembl.xref_id("G", response_format="bytes")
+    assert isinstance(body, bytes) and json.loads(body)["path"] == "/xrefs/id/G"
+
+
+def test_memoized_results_expire_after_ttl(server, monkeypatch):
+    monkeypatch.setattr(ensembl, "_memo_ttl", 0.2)
+    ensembl.assembly_info("human")
+    ensembl.assembly_info("human")
+    assert len(server.log) == 1
+    time.sleep(0.25)
+    ensembl.assembly_info("human")
+    assert len(server.log) == 2
+
+
+def test_etag_revalidation_reuses_body_on_304(server):
+    server.headers = {"ETag": '"v1"'}
+    server.respond = lambda record: 304 if record["headers"].get("If-None-Match") == '"v1"' else {"n": len(server.log)}
+    first = ensembl.xref_id("G")
+    assert ensembl.xref_id("G") == first == {"n": 1}
+    assert [record["headers"].get("If-None-Match") for record in server.log] == [None, '"v1"']
+
+
+def test_batching_proxy_routes_results_by_echoed_id(server):
+    def respond(record):
+        ids = record["body"]["ids"][::-1]
+        if "variant_recoder" in record["path"]:
+            return [{"A": {"input": i, "n": i.upper()}} for i in ids]
+        return [{"input": i, "n": i.upper()} for i in ids]
+
+    server.respond = respond
+    with ensembl.batch() as batch:
+        vep = [batch.vep_id(i, "human") for i in ("rs1", "rs2", "rs3")]
+        recoded = [batch.variant_recoder(i, "human") for i in ("rs4", "rs5")]
+    assert [future.result()["n"] for future in vep] == ["RS1", "RS2", "RS3"]
+    assert [future.result()["A"]["n"] for future in recoded] == ["RS4", "RS5"]
+    assert len(server.log) == 2
+
+
+def test_iter_pages_follows_next_page_token(server):
+    tokens = {None: "p2", "p2": "p3"}
+
+    def respond(record):
+        token = record["body"].get("pageToken")
+        return {"page": token, "nextPageToken": tokens[token]} if token in tokens else {"page": token}
+
+    server.respond = respond
+    assert [page["page"] for page in ensembl.iter_pages(ensembl.gadataset, pageSize=1)] == [None, "p2", "p3"]
+    assert [record["body"] for record in server.log] == [
+        {"pageSize": 1}, {"pageSize": 1, "pageToken": "p2"}, {"pageSize": 1, "pageToken": "p3"}]
+
+
+@pytest.mark.parametrize("response_format", ["json", "bytes"])
+def test_chunked_posts_merge_lists_and_maps(server, client, response_format):
+    def respond(record):
+        ids = record["body"]["ids"]
+        return [{"input": i} for i in ids] if "vep" in record["path"] else {i: {"id": i} for i in ids}
+
+    server.respond = respond
+    client.vep_batch_size = 2
+    decode = json.loads if response_format == "bytes" else lambda body: body
+    ids = [f"rs{i}" for i in range(5)]
+    assert decode(client.vep_id(ids, "human", response_format=response_format)) == [{"input": i} for i in ids]
+    assert len(server.log) == 3
+    ids = [f"ENSG{i}" for i in range(1001)]
+    assert decode(ensembl.lookup(ids, response_format=response_format)) == {i: {"id": i} for i in ids}
+    assert len(server.log) == 5
+
+
+def test_vep_options_and_bind_become_query_params(server, client):
+    ensembl.vep_id(["rs1", "rs2"], "human", options=ensembl.VepOptions(canonical=1, hgvs=1))
+    assert server.log[-1]["query"] == {"canonical": "1", "hgvs": "1"}
+    vep = client.bind("vep_id", species="human", canonical=1)
+    vep(["rs1", "rs2"], hgvs=1)
+    assert (server.log[-1]["path"], server.log[-1]["query"]) == ("/vep/human/id", {"canonical": "1", "hgvs": "1"})
+    with pytest.raises(TypeError):
+        client.bind("vep_id", no_such_option=1)
+
+
+def test_unsupported_choice_raises_before_request(server):
+    with pytest.raises(ValueError, match="unsupported feature"):
+        ensembl.overlap_region("human", "7:1-2", feature=["gene", "nope"])
+    assert server.log == []
+    ensembl.overlap_region("human", "7:1-2", feature="gene")
+    assert server.log[-1]["query"] == {"feature": "gene"}
+
+
+def test_empty_lists_short_circuit(server, client):
+    assert ensembl.lookup([]) == {}
+    assert client.vep_id([], "human") == []
+    assert ensembl.lookup([], response_format="bytes") == b"{}"
+    assert server.log == []